@@ -0,0 +1,377 @@
+"""
+Hi! This file defines a benchmark suite for the sorting algorithms, which runs each sort over families of inputs (random, sorted, reversed, ...) at sizes from 10 to 10^6 values, and measures how long it took and how much work it did.
+Here's an example:
+
+  >> python benchmark.py run --sizes 10 100 1000 --output results.json
+  >> python benchmark.py compare results.json baseline.json
+
+  - The time complexities in each sort's documentation only describe how the running time grows with n, and hide the constants; e.g. insertion sort is O(n^2), but beats merge sort on small or nearly sorted arrays. The only way to know which sort is faster on a given shape of input is to run it.
+
+  - Each run reports these measurements:
+
+    - time, the fastest of several runs (in seconds), each on a fresh copy of the same input. The fastest run is the one least disturbed by anything else running on the machine.
+
+    - comparisons, the number of times two values were compared (with <, >, <=, >= or ==). Each value is wrapped in a Counted object that counts its comparisons, so this is measured in a separate run from time.
+
+    - writes, the number of values written into the array being sorted (a swap is two writes). The array is a CountingList, a list that counts its writes, so this is also measured in a separate run. Writes into temporary lists (e.g. merge sort's copy of the shorter run) are not counted.
+
+    - swaps, moves and passes, as counted by a Counters object (see instrumentation.py), for the sorts that take a counters argument (bubble sort, selection sort and (binary) insertion sort). These are measured in another separate run, and are null for the other sorts.
+
+    - peak_memory, the largest amount of memory (in bytes) allocated at once while sorting, not counting the input itself, as measured by tracemalloc.
+
+  - The quadratic sorts (bubble sort, selection sort and (binary) insertion sort) would take hours on 10^6 values, so they are skipped above a cutoff (2000 values by default).
+
+  - radix_sort only sorts integers, so it is only run on the integer families (i.e. not records), and its comparisons are null. The same goes for parallel_sort, which starts a pool of worker processes, and so is only run when asked for (with --parallel).
+
+  - Results are written as JSON. compare matches each run against a saved baseline, and flags a regression if time or peak_memory grew by more than a threshold (10% by default), or if comparisons, writes, swaps, moves or passes grew at all (since the inputs are generated from a fixed seed, these are exactly reproducible).
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tracemalloc
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable
+from bubble_sort import bubble_sort
+from selection_sort import selection_sort
+from insertion_sort import insertion_sort
+from merge_sort import merge_sort
+from quick_sort import quick_sort
+from heap_sort import heap_sort
+from radix_sort import radix_sort
+from parallel_sort import parallel_sort
+from sort import sort
+from instrumentation import Counters
+
+SIZES:list = [10, 100, 1000, 10**4, 10**5, 10**6]
+QUADRATIC_CUTOFF:int = 2000
+REPEAT:int = 3
+THRESHOLD:float = 0.10
+
+class Record():
+  # A large record (e.g. a row of a table), sorted by its key.
+  __slots__ = ("key", "payload")
+
+  def __init__(self, key:int, payload:bytes) -> None:
+    self.key = key
+    self.payload = payload
+
+  def __lt__(self, other:"Record") -> bool:
+    return self.key < other.key
+
+  def __gt__(self, other:"Record") -> bool:
+    return self.key > other.key
+
+  def __le__(self, other:"Record") -> bool:
+    return self.key <= other.key
+
+  def __ge__(self, other:"Record") -> bool:
+    return self.key >= other.key
+
+  def __eq__(self, other:"Record") -> bool:
+    return self.key == other.key
+
+class Counted():
+  # Wraps a value, and counts every comparison with another Counted value in the shared counts list.
+  __slots__ = ("value", "counts")
+
+  def __init__(self, value:Any, counts:list) -> None:
+    self.value = value
+    self.counts = counts
+
+  def __lt__(self, other:"Counted") -> bool:
+    self.counts[0] += 1
+    return self.value < other.value
+
+  def __gt__(self, other:"Counted") -> bool:
+    self.counts[0] += 1
+    return self.value > other.value
+
+  def __le__(self, other:"Counted") -> bool:
+    self.counts[0] += 1
+    return self.value <= other.value
+
+  def __ge__(self, other:"Counted") -> bool:
+    self.counts[0] += 1
+    return self.value >= other.value
+
+  def __eq__(self, other:"Counted") -> bool:
+    self.counts[0] += 1
+    return self.value == other.value
+
+class CountingList(list):
+  # A list that counts the values written into it.
+
+  def __init__(self, values:list) -> None:
+    super().__init__(values)
+    self.writes:int = 0
+
+  def __setitem__(self, i:Any, value:Any) -> None:
+    if isinstance(i, slice):
+      value = list(value)
+      self.writes += len(value)
+    else:
+      self.writes += 1
+    super().__setitem__(i, value)
+
+def nearly_sorted(n:int, rng:random.Random) -> list:
+  # A sorted array with n // 100 (at least one) random pairs of values swapped.
+  array:list = list(range(n))
+  for _ in range(max(1, n // 100)):
+    i:int = rng.randrange(n)
+    j:int = rng.randrange(n)
+    array[i], array[j] = array[j], array[i]
+  return array
+
+FAMILIES:dict = {
+  "random": lambda n, rng: [rng.randrange(1 << 30) for _ in range(n)],
+  "sorted": lambda n, rng: list(range(n)),
+  "reversed": lambda n, rng: list(range(n, 0, -1)),
+  "few_unique": lambda n, rng: [rng.randrange(8) for _ in range(n)],
+  "nearly_sorted": nearly_sorted,
+  "organ_pipe": lambda n, rng: list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+  "records": lambda n, rng: [Record(rng.randrange(n), bytes(64)) for _ in range(n)],
+}
+
+INTEGER_FAMILIES:list = [family for family in FAMILIES if family != "records"]
+
+# Each sort, whether it is quadratic (i.e. skipped above the cutoff), whether it takes a counters argument, and whether it only sorts integers.
+ALGORITHMS:dict = {
+  "bubble_sort": (bubble_sort, True, True, False),
+  "selection_sort": (selection_sort, True, True, False),
+  "insertion_sort": (insertion_sort, True, True, False),
+  "binary_insertion_sort": (partial(insertion_sort, binary=True), True, True, False),
+  "merge_sort": (merge_sort, False, False, False),
+  "quick_sort": (quick_sort, False, False, False),
+  "heap_sort": (heap_sort, False, False, False),
+  "sort": (sort, False, False, False),
+  "radix_sort": (radix_sort, False, False, True),
+}
+
+# Sorts that start worker processes, which are only run when asked for.
+PARALLEL_ALGORITHMS:dict = {
+  "parallel_sort": (parallel_sort, False, False, True),
+}
+
+def generate(family:str, n:int, seed:int=0) -> list:
+  """
+  Generates an input of n values from the given family. The same family, n and seed always generate the same input.
+
+  Input:
+    - family (str)
+      The name of an input family in FAMILIES.
+    - n (int)
+      The number of values.
+    - seed (int)
+      The seed for the random number generator (defaults to 0).
+  Output:
+    - array (list)
+      A list of n values.
+  """
+  return FAMILIES[family](n, random.Random(seed))
+
+def measure(sort:Callable, array:list, repeat:int=REPEAT, counted:bool=False, integers:bool=False) -> dict:
+  """
+  Sorts copies of the array, and measures the time, comparisons, writes, swaps, moves, passes and peak memory taken. Raises an AssertionError if the sort doesn't sort the array.
+
+  Input:
+    - sort (Callable)
+      A function that sorts a list in place.
+    - array (list)
+      A list of values, which is not modified.
+    - repeat (int)
+      The number of timed runs, of which the fastest is reported (defaults to 3).
+    - counted (bool)
+      Whether the sort takes a counters argument, which swaps, moves and passes are read from (defaults to false).
+    - integers (bool)
+      Whether the sort only sorts integers, and so can't sort Counted values; its comparisons are not measured (defaults to false).
+  Output:
+    - result (dict)
+      The time (in seconds), comparisons, writes, swaps, moves, passes and peak_memory (in bytes). Measurements that weren't taken are None.
+  """
+  expected:list = sorted(array)
+
+  time:float = float("inf")
+  for _ in range(repeat):
+    copy:list = list(array)
+    start:float = perf_counter()
+    sort(copy)
+    time = min(time, perf_counter() - start)
+  assert copy == expected, "sort did not sort the array"
+
+  comparisons:int = None
+  if integers:
+    writes:CountingList = CountingList(array)
+    sort(writes)
+  else:
+    counts:list = [0]
+    writes = CountingList([Counted(value, counts) for value in array])
+    sort(writes)
+    comparisons = counts[0]
+
+  counters:Counters = None
+  if counted:
+    counters = Counters()
+    sort(list(array), counters=counters)
+
+  copy = list(array)
+  tracemalloc.start()
+  sort(copy)
+  peak_memory:int = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+
+  return {
+    "time": time,
+    "comparisons": comparisons,
+    "writes": writes.writes,
+    "swaps": None if counters is None else counters.swaps,
+    "moves": None if counters is None else counters.moves,
+    "passes": None if counters is None else counters.passes,
+    "peak_memory": peak_memory,
+  }
+
+def benchmark(algorithms:list=None, families:list=None, sizes:list=None, quadratic_cutoff:int=QUADRATIC_CUTOFF, repeat:int=REPEAT, seed:int=0, log:Callable=None, parallel:bool=False) -> dict:
+  """
+  Measures every algorithm on every family of inputs at every size, skipping quadratic algorithms above the cutoff, and integer-only algorithms on the records family.
+
+  Input:
+    - algorithms (list)
+      The names of algorithms in ALGORITHMS or PARALLEL_ALGORITHMS (defaults to all of ALGORITHMS, and PARALLEL_ALGORITHMS if parallel is true).
+    - families (list)
+      The names of input families in FAMILIES (defaults to all of them).
+    - sizes (list)
+      The input sizes (defaults to SIZES).
+    - quadratic_cutoff (int)
+      The largest input size that quadratic algorithms are run on (defaults to 2000).
+    - repeat (int)
+      The number of timed runs per input (defaults to 3).
+    - seed (int)
+      The seed the inputs are generated from (defaults to 0).
+    - log (Callable)
+      A function called with each result as it is measured (defaults to none).
+    - parallel (bool)
+      Whether to run the algorithms in PARALLEL_ALGORITHMS by default (defaults to false).
+  Output:
+    - report (dict)
+      The Python version and settings used, and a list of results (one per algorithm, family and size).
+  """
+  available:dict = {**ALGORITHMS, **PARALLEL_ALGORITHMS}
+  if algorithms is None:
+    algorithms = list(ALGORITHMS) + (list(PARALLEL_ALGORITHMS) if parallel else [])
+  families = list(FAMILIES) if families is None else families
+  sizes = SIZES if sizes is None else sizes
+
+  results:list = []
+  for n in sizes:
+    for family in families:
+      array:list = generate(family, n, seed)
+      for name in algorithms:
+        sort, quadratic, counted, integers = available[name]
+        if (quadratic and (n > quadratic_cutoff)) or (integers and (family not in INTEGER_FAMILIES)):
+          continue
+        result:dict = {"algorithm": name, "family": family, "size": n}
+        result.update(measure(sort, array, repeat, counted, integers))
+        results.append(result)
+        if log is not None:
+          log(result)
+
+  return {
+    "python": platform.python_version(),
+    "seed": seed,
+    "repeat": repeat,
+    "results": results,
+  }
+
+def compare(results:dict, baseline:dict, threshold:float=THRESHOLD) -> list:
+  """
+  Compares results against a baseline, matching runs by algorithm, family and size. A run has regressed if its time or peak_memory grew by more than the threshold, or if its comparisons, writes, swaps, moves or passes grew at all (measurements that are None in either are skipped).
+
+  Input:
+    - results (dict)
+      A report returned by benchmark().
+    - baseline (dict)
+      A saved report returned by benchmark().
+    - threshold (float)
+      The fraction that time and peak_memory may grow by (defaults to 0.10).
+  Output:
+    - regressions (list)
+      A list of (algorithm, family, size, measurement, baseline value, new value) tuples.
+  """
+  saved:dict = {}
+  for result in baseline["results"]:
+    saved[(result["algorithm"], result["family"], result["size"])] = result
+
+  regressions:list = []
+  for result in results["results"]:
+    run:tuple = (result["algorithm"], result["family"], result["size"])
+    if run not in saved:
+      continue
+    for measurement, allowed in (("time", threshold), ("peak_memory", threshold), ("comparisons", 0), ("writes", 0), ("swaps", 0), ("moves", 0), ("passes", 0)):
+      old = saved[run].get(measurement)
+      new = result.get(measurement)
+      if (old is None) or (new is None):
+        continue
+      if new > old * (1 + allowed):
+        regressions.append(run + (measurement, old, new))
+  return regressions
+
+def format_result(result:dict) -> str:
+  # Measurements that weren't taken are shown as "-".
+  shown:dict = {measurement: ("-" if value is None else value) for measurement, value in result.items()}
+  return "{algorithm:>21} {family:>14} {size:>8} {time:>12.6f}s {comparisons:>12} comparisons {writes:>12} writes {swaps:>12} swaps {moves:>12} moves {passes:>8} passes {peak_memory:>10} bytes".format(**shown)
+
+def main(argv:list=None) -> int:
+  parser = argparse.ArgumentParser(description="Benchmarks the sorting algorithms.")
+  commands = parser.add_subparsers(dest="command", required=True)
+
+  run = commands.add_parser("run", help="run the benchmarks, and write the results as JSON")
+  run.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS) + list(PARALLEL_ALGORITHMS), default=None)
+  run.add_argument("--parallel", action="store_true", help="also run the sorts that start worker processes")
+  run.add_argument("--families", nargs="+", choices=list(FAMILIES), default=None)
+  run.add_argument("--sizes", nargs="+", type=int, default=None)
+  run.add_argument("--quadratic-cutoff", type=int, default=QUADRATIC_CUTOFF)
+  run.add_argument("--repeat", type=int, default=REPEAT)
+  run.add_argument("--seed", type=int, default=0)
+  run.add_argument("--output", default=None, help="file to write the results to (defaults to stdout)")
+  run.add_argument("--baseline", default=None, help="saved results to compare against")
+  run.add_argument("--threshold", type=float, default=THRESHOLD)
+
+  check = commands.add_parser("compare", help="compare saved results against a saved baseline")
+  check.add_argument("results")
+  check.add_argument("baseline")
+  check.add_argument("--threshold", type=float, default=THRESHOLD)
+
+  args = parser.parse_args(argv)
+
+  if args.command == "run":
+    log:Callable = lambda result: print(format_result(result), file=sys.stderr)
+    results:dict = benchmark(args.algorithms, args.families, args.sizes, args.quadratic_cutoff, args.repeat, args.seed, log, args.parallel)
+    if args.output is None:
+      print(json.dumps(results, indent=2))
+    else:
+      with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    if args.baseline is None:
+      return 0
+    baseline_path:str = args.baseline
+  else:
+    with open(args.results) as file:
+      results = json.load(file)
+    baseline_path = args.baseline
+
+  with open(baseline_path) as file:
+    baseline:dict = json.load(file)
+  regressions:list = compare(results, baseline, args.threshold)
+  for algorithm, family, size, measurement, old, new in regressions:
+    print("REGRESSION {} {} {}: {} {} -> {}".format(algorithm, family, size, measurement, old, new), file=sys.stderr)
+  if regressions:
+    return 1
+  print("No regressions", file=sys.stderr)
+  return 0
+
+if __name__ == "__main__":
+
+  sys.exit(main())
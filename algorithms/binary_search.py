@@ -0,0 +1,406 @@
+"""
+Hi! This file defines binary search for sorted arrays, a searching algorithm that works by repeatedly halving the part of the array that could contain the value being searched for.
+
+  - Recall the find() method of StaticArray, DynamicArray and LinkedArray, which compares the value being searched for against every stored value in turn, taking O(n) time. If the array is sorted, each comparison also tells us which side of the compared value the searched value must be on, so half of the remaining values can be ignored after every comparison.
+
+  - Here's an example:
+
+    >>  array = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9], value = 6
+
+    - Binary search keeps a range [lo, hi) of indices that could hold the first value >= the searched value (the lower bound), initialised to the whole array. The middle value of the range is compared with the searched value, and the range is halved.
+
+    while lo < hi:
+
+      mid = (lo + hi) // 2
+
+      if array[mid] < value:
+        lo = mid + 1
+      else:
+        hi = mid
+
+    lo = 0, hi = 10, mid = 5
+    array[mid] < value == True (i.e. array[5] < 6 == 5 < 6 == True)
+    lo = 6
+
+    lo = 6, hi = 10, mid = 8
+    array[mid] < value == False (i.e. array[8] < 6 == 8 < 6 == False)
+    hi = 8
+
+    lo = 6, hi = 8, mid = 7
+    array[mid] < value == False (i.e. array[7] < 6 == 7 < 6 == False)
+    hi = 7
+
+    lo = 6, hi = 7, mid = 6
+    array[mid] < value == False (i.e. array[6] < 6 == 6 < 6 == False)
+    hi = 6
+
+    lo == hi == 6, so the lower bound is 6
+
+    - The lower bound is where the value would be inserted to keep the array sorted, before any equal values. The upper bound is the same, but after any equal values (i.e. the first value > the searched value), and the values equal to the searched value are exactly those between the lower bound and upper bound (the equal range).
+
+  - Every function here takes an optional key function, which is applied to the stored values (but not to the searched value, which should already be a key), so that arrays of records sorted by a key can be searched without building a list of keys.
+
+  - When many values need to be searched for, and they are sorted themselves, batch_search finds all of them in a single pass over the array. Each search starts where the previous one ended, and gallops forward (1, 2, 4, 8, ... values) before binary searching, so m searches take O(m log(n/m)) comparisons rather than O(m log n).
+
+  - For large arrays that are searched many times but never modified, eytzinger rearranges a sorted array into breadth-first order (the root of the implicit search tree first, then its two children, then their four children, ...), the same layout as a heap. eytzinger_search then always moves from index k to 2k+1 or 2k+2, so the next few comparisons are close together in memory, and the choice between them can be computed without a branch.
+
+The best-case time complexity is O(1):
+
+  - If the range being searched is empty (or, for batch_search, each value is found right where the previous search ended).
+
+The average/worst-case time complexity is O(log n):
+
+  - Each comparison halves the range, so after k comparisons, n / 2^k values are left. Defining 'n' as the number of values for a given array (i.e. the length of the array), the search ends when n / 2^k = 1:
+
+  c * log(n) + c
+
+  - The greatest term is log(n), and thus the average/worst-case time complexity is O(log n).
+
+The best/average/worst-case space complexity is O(1). Here's an explanation:
+
+  - Binary search only keeps track of lo, hi and mid. Thus, any auxiliary space used is constant:
+
+  c
+
+  - The greatest term is a constant value, and thus the space complexity is O(1). (batch_search and eytzinger return new lists, which take O(m) and O(n) space respectively.)
+"""
+
+from typing import Any, Callable
+
+def binary_search(array:list, value:Any, key:Callable=None) -> int:
+  """
+  Finds the index of the first stored value equal to value in a sorted array, like the find() method of the arrays, but in O(log n) time. Raises a ValueError if value is not stored.
+
+  Input:
+    - array (list)
+      A list of sorted values.
+    - value
+      The value to search for.
+    - key (Callable)
+      A function applied to the stored values before comparing them with value (defaults to none).
+  Output:
+    - index (int)
+      The index of the first value equal to value.
+  Time Complexity:
+    - Best-case
+      O(log n)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  i:int = lower_bound(array, value, key=key)
+  if i < len(array):
+    found = array[i] if key is None else key(array[i])
+    if not (value < found):
+      return i
+  raise ValueError
+
+def lower_bound(array:list, value:Any, lo:int=0, hi:int=None, key:Callable=None) -> int:
+  """
+  Finds the first index in the sorted array[lo:hi] where the stored value is >= value, i.e. where value would be inserted before any equal values.
+
+  Input:
+    - array (list)
+      A list of sorted values.
+    - value
+      The value to search for.
+    - lo (int)
+      The index of the first value to search (defaults to the start of the array).
+    - hi (int)
+      The index after the last value to search (defaults to the end of the array).
+    - key (Callable)
+      A function applied to the stored values before comparing them with value (defaults to none).
+  Output:
+    - index (int)
+      The lower bound, between lo and hi.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  if hi is None:
+    hi = len(array)
+
+  if key is None:
+    while lo < hi:
+      mid:int = (lo + hi) // 2
+      if array[mid] < value:
+        lo = mid + 1
+      else:
+        hi = mid
+  else:
+    while lo < hi:
+      mid = (lo + hi) // 2
+      if key(array[mid]) < value:
+        lo = mid + 1
+      else:
+        hi = mid
+
+  return lo
+
+def upper_bound(array:list, value:Any, lo:int=0, hi:int=None, key:Callable=None) -> int:
+  """
+  Finds the first index in the sorted array[lo:hi] where the stored value is > value, i.e. where value would be inserted after any equal values.
+
+  Input:
+    - array (list)
+      A list of sorted values.
+    - value
+      The value to search for.
+    - lo (int)
+      The index of the first value to search (defaults to the start of the array).
+    - hi (int)
+      The index after the last value to search (defaults to the end of the array).
+    - key (Callable)
+      A function applied to the stored values before comparing them with value (defaults to none).
+  Output:
+    - index (int)
+      The upper bound, between lo and hi.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  if hi is None:
+    hi = len(array)
+
+  if key is None:
+    while lo < hi:
+      mid:int = (lo + hi) // 2
+      if value < array[mid]:
+        hi = mid
+      else:
+        lo = mid + 1
+  else:
+    while lo < hi:
+      mid = (lo + hi) // 2
+      if value < key(array[mid]):
+        hi = mid
+      else:
+        lo = mid + 1
+
+  return lo
+
+def equal_range(array:list, value:Any, key:Callable=None) -> tuple:
+  """
+  Finds the range of indices [lower bound, upper bound) of the stored values equal to value in a sorted array. The range is empty (lower bound == upper bound) if value is not stored.
+
+  Input:
+    - array (list)
+      A list of sorted values.
+    - value
+      The value to search for.
+    - key (Callable)
+      A function applied to the stored values before comparing them with value (defaults to none).
+  Output:
+    - lo, hi (tuple)
+      The lower bound and upper bound of value.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  lo:int = lower_bound(array, value, key=key)
+  return lo, upper_bound(array, value, lo, key=key)
+
+def batch_search(array:list, values:list, key:Callable=None, right:bool=False) -> list:
+  """
+  Finds the lower bound (or upper bound) of each of many values in a sorted array, in a single pass. The values must be sorted too; each search starts from the previous result, gallops forward (1, 2, 4, 8, ... values) until it passes the value, and then binary searches the last gap. Raises a ValueError if values is not sorted.
+
+  Input:
+    - array (list)
+      A list of sorted values.
+    - values (list)
+      A list of sorted values to search for.
+    - key (Callable)
+      A function applied to the stored values before comparing them with values (defaults to none).
+    - right (bool)
+      Whether to find upper bounds rather than lower bounds (defaults to lower bounds).
+  Output:
+    - bounds (list)
+      A list of the lower bounds (or upper bounds), in the same order as values.
+  Time Complexity:
+    - Best-case
+      O(m)
+    - Average-case
+      O(m log(n/m)), where m is the number of values searched for
+    - Worst-case
+      O(m log(n/m))
+  Space Complexity:
+    - Best-case
+      O(m)
+    - Average-case
+      O(m)
+    - Worst-case
+      O(m)
+  """
+  n:int = len(array)
+  bound:Callable = upper_bound if right else lower_bound
+  bounds:list = []
+  lo:int = 0
+  previous:Any = None
+
+  for i in range(len(values)):
+
+    value = values[i]
+    if (i > 0) and (value < previous):
+      raise ValueError
+    previous = value
+
+    # Gallop forward until array[probe] is past value (or the end is reached).
+    step:int = 1
+    probe:int = lo
+    while probe < n:
+      stored = array[probe] if key is None else key(array[probe])
+      if (value < stored) if right else not (stored < value):
+        break
+      lo = probe + 1
+      probe = lo + step
+      step *= 2
+
+    lo = bound(array, value, lo, min(probe, n), key)
+    bounds.append(lo)
+
+  return bounds
+
+def eytzinger(array:list) -> list:
+  """
+  Rearranges a sorted array into breadth-first (Eytzinger) order, where the children of the value at index k are at indices 2k+1 and 2k+2, and every value is greater than or equal to everything in its left subtree, and less than or equal to everything in its right subtree.
+
+  Input:
+    - array (list)
+      A list of sorted values.
+  Output:
+    - layout (list)
+      A new list of the same values, in breadth-first order.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  n:int = len(array)
+  layout:list = [None for _ in range(n)]
+
+  # An in-order walk of the implicit tree visits its indices in sorted order.
+  i:int = 0
+  k:int = 0
+  stack:list = []
+  while stack or (k < n):
+    if k < n:
+      stack.append(k)
+      k = 2*k + 1
+    else:
+      k = stack.pop()
+      layout[k] = array[i]
+      i += 1
+      k = 2*k + 2
+
+  return layout
+
+def eytzinger_search(layout:list, value:Any, key:Callable=None) -> int:
+  """
+  Finds the lower bound of value in an array rearranged by eytzinger, i.e. the index (in the layout) of the smallest stored value that is >= value. Returns len(layout) if every stored value is < value.
+
+  Input:
+    - layout (list)
+      A list of values in breadth-first order (see eytzinger).
+    - value
+      The value to search for.
+    - key (Callable)
+      A function applied to the stored values before comparing them with value (defaults to none).
+  Output:
+    - index (int)
+      The index of the lower bound in the layout, or len(layout).
+  Time Complexity:
+    - Best-case
+      O(log n)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  n:int = len(layout)
+
+  # Using 1-based positions j (index j-1), the children of j are 2j and 2j+1.
+  j:int = 1
+  if key is None:
+    while j <= n:
+      j = 2*j + (layout[j-1] < value)
+  else:
+    while j <= n:
+      j = 2*j + (key(layout[j-1]) < value)
+
+  # The lower bound is where the search last went left; strip the right turns (trailing 1 bits) taken after it, and then the left turn itself.
+  j >>= ((~j) & (j + 1)).bit_length()
+
+  if j == 0:
+    return n
+  return j - 1
+
+
+if __name__ == "__main__":
+
+  array = [0, 1, 2, 3, 3, 3, 6, 7, 8, 9]
+  print(array)
+  print(binary_search(array, 6))
+  print(lower_bound(array, 3), upper_bound(array, 3), equal_range(array, 3))
+  print(batch_search(array, [1, 3, 5, 9]))
+
+  layout = eytzinger(array)
+  print(layout)
+  print(layout[eytzinger_search(layout, 5)])
@@ -84,13 +84,17 @@ The best/average/worst-case space complexity is O(1). Here's an explanation:
   - The greatest term is a constant value, and thus the space complexity is O(1).
 """
 
-def bubble_sort(array:list) -> None:
+from instrumentation import Counters
+
+def bubble_sort(array:list, counters:Counters=None) -> None:
   """
   A stable sorting algorithm that works by traversing an array from the end, to the start where it iteratively accumulates the minimum values in their sorted positions.
 
   Input:
     - array (list)
       A list of values.
+    - counters (Counters)
+      Counts the comparisons, swaps and passes made, if given (defaults to none). See instrumentation.py.
   Output:
     - array (list)
       A list of sorted values.
@@ -109,6 +113,10 @@ def bubble_sort(array:list) -> None:
     - Worst-case
       O(1)
   """
+  if counters is not None:
+    _bubble_sort_counted(array, counters)
+    return
+
   n:int = len(array)
   
   for i in range(n):
@@ -125,6 +133,27 @@ def bubble_sort(array:list) -> None:
     if not swapped:
       break
 
+def _bubble_sort_counted(array:list, counters:Counters) -> None:
+  # bubble_sort, reporting every comparison, swap and pass to counters.
+  n:int = len(array)
+
+  for i in range(n):
+
+    counters.next_pass()
+    swapped:bool = False
+
+    for j in range(n-1, i, -1):
+
+      counters.compare(j-1, j)
+      if array[j-1] > array[j]:
+
+        counters.swap(j-1, j)
+        swap(array, j-1, j)
+        swapped = True
+
+    if not swapped:
+      break
+
 def swap(array:list, i:int, j:int) -> None:
   """
   Swaps the value at index i with the value at index j for a given array.
@@ -0,0 +1,205 @@
+"""
+Hi! This file defines external sort, which sorts more records than fit in memory, by sorting them in chunks that do fit, storing each sorted chunk (a run) in a temporary file, and then merging the runs.
+
+  - Every other sort in this folder sorts an array that is held in memory all at once. External sort only ever holds one chunk of records (while making runs), or one block of records from each run being merged (while merging), so its memory use depends on chunk_size, fan_in and buffer_size, but not on the number of records.
+
+  - Here's an example (with chunk_size = 4):
+
+    >>  records = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+
+    - First, records are read in chunks of chunk_size, and each chunk is sorted in memory with sort() (see sort.py) and written to a temporary file. Records are written in blocks of buffer_size records, in Python's compact binary pickle format, so any records that can be pickled can be sorted.
+
+    run 0 = [0, 2, 3, 9]
+    run 1 = [4, 5, 6, 7]
+    run 2 = [1, 8]
+
+    - Then the runs are merged with a k-way merge; a heap holds the next record of each run, and the smallest record is repeatedly taken from the heap and replaced with the next record of its run. Each run is read one block at a time.
+
+    >>  sorted = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    - Merging too many runs at once would need too many open files and blocks in memory, so at most fan_in runs are merged at once. If there are more runs than that, groups of fan_in runs are merged into longer runs (in new temporary files) until at most fan_in runs are left, and those are merged into the output.
+
+  - When two records are equal, the record from the earlier run is always taken first, and sort() is stable, so external sort is stable.
+
+  - If every record fits in a single chunk, nothing is written to disk.
+
+  - external_sort returns an iterator over the sorted records, which can be written anywhere as it is read. sort_file sorts the lines of a text file into another text file.
+
+The best/average/worst-case time complexity is O(n log n):
+
+  - Defining 'n' as the number of records, 'm' as chunk_size, and 'k' as fan_in, the n/m runs each take O(m log m) time to sort. Each merge pass reads and writes every record once, taking O(log k) time per record, and there are log_k(n/m) passes:
+
+  c * n * log(m) + c * n * log(k) * log_k(n/m) + c
+
+  - This simplifies to c * n * log(n), and thus the time complexity is O(n log n). Each pass also reads and writes every record on disk, so the number of passes matters most in practice.
+
+The best/average/worst-case space complexity is O(m + k * b). Here's an explanation:
+
+  - Defining 'b' as buffer_size, at most one chunk of m records is held in memory while making runs, and one block of b records from each of k runs while merging:
+
+  c * m + c * k * b + c
+
+  - This does not depend on n, and thus the memory used is bounded. The temporary files take O(n) disk space.
+"""
+
+import heapq
+import os
+import pickle
+import shutil
+import tempfile
+from itertools import count
+from typing import Callable, Iterable, Iterator
+from sort import sort
+
+CHUNK_SIZE:int = 100000
+FAN_IN:int = 16
+BUFFER_SIZE:int = 1024
+
+def external_sort(records:Iterable, key:Callable=None, reverse:bool=False, chunk_size:int=CHUNK_SIZE, fan_in:int=FAN_IN, buffer_size:int=BUFFER_SIZE, temp_dir:str=None) -> Iterator:
+  """
+  A stable sorting algorithm for more records than fit in memory, which sorts chunks of records in memory, spills them to temporary files as sorted runs, and then merges the runs.
+
+  Input:
+    - records (Iterable)
+      The records to sort (e.g. a list, a generator, or a file opened in text mode, which gives its lines).
+    - key (Callable)
+      A function applied to each record, to find the key it is sorted by (defaults to none, i.e. the records themselves).
+    - reverse (bool)
+      Whether to sort in descending order (defaults to false).
+    - chunk_size (int)
+      The number of records sorted in memory at once (defaults to 100000).
+    - fan_in (int)
+      The largest number of runs merged at once (defaults to 16).
+    - buffer_size (int)
+      The number of records read from or written to a run file at once (defaults to 1024).
+    - temp_dir (str)
+      The directory the temporary files are made in (defaults to the system's temporary directory).
+  Output:
+    - records (Iterator)
+      An iterator over the sorted records. The temporary files are deleted once it is exhausted (or closed).
+  Time Complexity:
+    - Best-case
+      O(n log n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(m + k * b)
+    - Average-case
+      O(m + k * b)
+    - Worst-case
+      O(m + k * b)
+  """
+  if (chunk_size < 1) or (fan_in < 2) or (buffer_size < 1):
+    raise ValueError
+  return _external_sort(records, key, reverse, chunk_size, fan_in, buffer_size, temp_dir)
+
+def sort_file(input_path:str, output_path:str, key:Callable=None, reverse:bool=False, chunk_size:int=CHUNK_SIZE, fan_in:int=FAN_IN, buffer_size:int=BUFFER_SIZE, temp_dir:str=None) -> None:
+  """
+  Sorts the lines of a text file into another text file, with external_sort.
+
+  Input:
+    - input_path (str)
+      The file to read lines from.
+    - output_path (str)
+      The file to write the sorted lines to.
+    - key, reverse, chunk_size, fan_in, buffer_size, temp_dir
+      See external_sort.
+  Output:
+    - None
+  Time Complexity:
+    - Best-case
+      O(n log n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(m + k * b)
+    - Average-case
+      O(m + k * b)
+    - Worst-case
+      O(m + k * b)
+  """
+  with open(input_path) as source, open(output_path, "w") as target:
+    for line in external_sort(source, key, reverse, chunk_size, fan_in, buffer_size, temp_dir):
+      target.write(line if line.endswith("\n") else line + "\n")
+
+def _external_sort(records:Iterable, key:Callable, reverse:bool, chunk_size:int, fan_in:int, buffer_size:int, temp_dir:str) -> Iterator:
+  directory:str = tempfile.mkdtemp(dir=temp_dir)
+  names:Iterator = count()
+  try:
+    runs:list = []
+    chunk:list = []
+    for record in records:
+      chunk.append(record)
+      if len(chunk) == chunk_size:
+        sort(chunk, key=key, reverse=reverse)
+        runs.append(_write_run(_run_path(directory, names), chunk, buffer_size))
+        chunk = []
+
+    if not runs:
+      sort(chunk, key=key, reverse=reverse)
+      yield from chunk
+      return
+
+    if chunk:
+      sort(chunk, key=key, reverse=reverse)
+      runs.append(_write_run(_run_path(directory, names), chunk, buffer_size))
+    chunk = None
+
+    while len(runs) > fan_in:
+      merged:list = []
+      for i in range(0, len(runs), fan_in):
+        group:list = runs[i:i + fan_in]
+        if len(group) == 1:
+          merged.append(group[0])
+          continue
+        merged.append(_write_run(_run_path(directory, names), _merge(group, key, reverse), buffer_size))
+        for path in group:
+          os.remove(path)
+      runs = merged
+
+    yield from _merge(runs, key, reverse)
+  finally:
+    shutil.rmtree(directory, ignore_errors=True)
+
+def _run_path(directory:str, names:Iterator) -> str:
+  return os.path.join(directory, "run{}.bin".format(next(names)))
+
+def _write_run(path:str, records:Iterable, buffer_size:int) -> str:
+  # Writes records to path in blocks of buffer_size records, each pickled as one list.
+  with open(path, "wb") as file:
+    block:list = []
+    for record in records:
+      block.append(record)
+      if len(block) == buffer_size:
+        pickle.dump(block, file, pickle.HIGHEST_PROTOCOL)
+        block = []
+    if block:
+      pickle.dump(block, file, pickle.HIGHEST_PROTOCOL)
+  return path
+
+def _read_run(path:str) -> Iterator:
+  # Reads a run back one block at a time.
+  with open(path, "rb") as file:
+    while True:
+      try:
+        block:list = pickle.load(file)
+      except EOFError:
+        return
+      yield from block
+
+def _merge(paths:list, key:Callable, reverse:bool) -> Iterator:
+  # A heap-based k-way merge, which takes equal records from earlier runs first.
+  return heapq.merge(*[_read_run(path) for path in paths], key=key, reverse=reverse)
+
+if __name__ == "__main__":
+
+  records = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+  print(records)
+  print(list(external_sort(records, chunk_size=4, fan_in=2, buffer_size=2)))
+  print(list(external_sort(records, reverse=True, chunk_size=4)))
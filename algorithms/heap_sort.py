@@ -0,0 +1,185 @@
+"""
+Hi! This file defines heap sort for arrays, an unstable sorting algorithm that works by arranging the array into a max-heap, and then repeatedly swapping the maximum value at the root of the heap to the end of the array, where it is in its sorted position.
+
+  - Recall the heap data structure (see data_structures/heap.py), which stores values in a flat array where the children of the value at index i are at indices d*i + 1 ... d*i + d, and every value is less than or equal to its children (a min-heap). Heap sort uses the same layout, but with every value greater than or equal to its children (a max-heap), and builds it directly inside the array being sorted, so no auxiliary array is needed.
+
+  - Here's an example (with d = 2):
+
+    >>  array = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+
+    - First, the array is heapified bottom-up; each value that has children is sifted down (swapped with its largest child, until it is no smaller than its children), starting from the last such value and ending at the root.
+
+    for i in (n//2 - 1...0):
+
+      sift_down(array, i, n)
+
+    >>  array = [9, 8, 7, 5, 4, 2, 6, 3, 0, 1]
+
+    - Notice that the maximum value is now at the root (index 0). Swapping it with the last value of the heap moves it into its sorted position, and shrinks the heap by one value. The value now at the root is sifted down to restore the heap.
+
+    for end in (n-1...1):
+
+      swap(array, 0, end)
+      sift_down(array, 0, end)
+
+    >>  array = [8, 5, 7, 3, 4, 2, 6, 1, 0, 9]
+           heap = [8, 5, 7, 3, 4, 2, 6, 1, 0]
+         sorted =                            [9]
+
+    - This is an invariant; at the end of each loop, the upper part of the array holds the largest values in their sorted positions, and the lower part is a max-heap of the remaining values.
+
+  - Heap sort is unstable; swapping the root to the end of the heap can move a value past other values that are equal to it.
+
+The best-case time complexity is O(n):
+
+  - If all values are equal, no value is ever moved down by a sift, so each sift takes O(1) time.
+
+The average/worst-case time complexity is O(n log n):
+
+  - Heapifying bottom-up takes O(n) time, since most values are near the bottom of the heap and are only sifted down a few levels. Each of the n - 1 removals then sifts a value down at most log_d(n) levels. Defining 'n' as the number of values for a given array (i.e. the length of the array):
+
+  c * n * log(n) + c * n + c
+
+  - The greatest term is n * log(n), and thus the average/worst-case time complexity is O(n log n).
+
+The best/average/worst-case space complexity is O(1). Here's an explanation:
+
+  - Heap sort is in-place, meaning it directly modifies the array without replicating it. Thus, any auxiliary space used is constant:
+
+  c
+
+  - The greatest term is a constant value, and thus the space complexity is O(1).
+"""
+
+def heap_sort(array:list, lo:int=0, hi:int=None, d:int=2) -> None:
+  """
+  An unstable sorting algorithm that works by arranging the array into a max-heap, and then repeatedly swapping the maximum value at the root of the heap to the end of the array, where it is in its sorted position.
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the first value to sort (defaults to the start of the array).
+    - hi (int)
+      The index after the last value to sort (defaults to the end of the array).
+    - d (int)
+      The number of children of each value in the heap (defaults to 2, a binary heap).
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  if hi is None:
+    hi = len(array)
+  n:int = hi - lo
+
+  for i in range((n - 2) // d, -1, -1):
+    sift_down(array, lo, i, n, d)
+
+  for end in range(n - 1, 0, -1):
+    swap(array, lo, lo + end)
+    sift_down(array, lo, 0, end, d)
+
+def sift_down(array:list, lo:int, i:int, n:int, d:int=2) -> None:
+  """
+  Moves the value at position i of the max-heap stored in array[lo:lo+n] down, until it is no smaller than its children. Rather than swapping at every level, larger children are moved up into the gap, and the value is written once into its final position.
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the root of the heap.
+    - i (int)
+      The position (relative to lo) of the value to move down.
+    - n (int)
+      The number of values in the heap.
+    - d (int)
+      The number of children of each value in the heap.
+  Output:
+    - array (list)
+      A list where array[lo:lo+n] is a max-heap below position i.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(d log n)
+    - Worst-case
+      O(d log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  value = array[lo + i]
+
+  while True:
+    first:int = d*i + 1
+    if first >= n:
+      break
+    child:int = first
+    for j in range(first + 1, min(first + d, n)):
+      if array[lo + child] < array[lo + j]:
+        child = j
+    if not (value < array[lo + child]):
+      break
+    array[lo + i] = array[lo + child]
+    i = child
+
+  array[lo + i] = value
+
+def swap(array:list, i:int, j:int) -> None:
+  """
+  Swaps the value at index i with the value at index j for a given array.
+
+  Input:
+    - array (list)
+      A list of values.
+    - i (int)
+      The index of the first value.
+    - j (int)
+      The index of the second value.
+  Output:
+    - array (list)
+      A list where the values at i and j are swapped.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  item = array[i]
+  array[i] = array[j]
+  array[j] = item
+
+
+if __name__ == "__main__":
+
+  array = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+  print(array)
+  heap_sort(array)
+  print(array)
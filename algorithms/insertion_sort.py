@@ -118,6 +118,14 @@ Hi! This file defines insertion sort for arrays, a stable sorting algorithm that
         sorted partition = [1, 2, 3, 4, 5 6a, 6b, 7]
       unsorted partition = []
 
+  - Each step of the swapping costs a comparison and a swap (three reads and writes), even though the sorted partition could be binary searched. With binary=True, insertion sort instead finds the next unsorted value's sorted position with a binary search (see binary_search.py) in O(log i) comparisons, and then shifts the values between that position and the value one place to the right with a single slice assignment, which moves the whole block at once.
+
+    - To keep the algorithm stable, the binary search finds the upper bound (i.e. the position after any values equal to the next unsorted value), so it is never moved in front of an equal value.
+
+    - The number of values moved is the same, so binary insertion sort still takes O(n^2) time in the worst case, but it only makes O(n log n) comparisons, which matters most when comparing values is expensive (e.g. strings, tuples or records with a key).
+
+  - insert_sorted(array, value) uses the same binary search to insert a single value into an array that is already sorted, keeping it sorted.
+
 The best-case time complexity is O(n):
 
   - Recall that when the sorted partition is extended, the next unsorted value is incrementally swapped towards a position that maintains the sorted partition's ascending order. However, if the input array is sorted, then the position of the next unsorted value doesn't violate the sorted partition's ascending order, and thus requires no additional swaps.
@@ -155,13 +163,25 @@ The best/average/worst-case space complexity is O(1). Here's an explanation:
   - The greatest term is a constant value, and thus the space complexity is O(1).
 """
 
-def insertion_sort(array:list) -> None:
+from typing import Any
+from binary_search import upper_bound
+from instrumentation import Counters
+
+def insertion_sort(array:list, lo:int=0, hi:int=None, counters:Counters=None, binary:bool=False) -> None:
   """
   A stable sorting algorithm that works by partitioning an array in two -- the lower sorted part iteratively accumulates unsorted values from the upper unsorted part, in their sorted positions, relative to the sorted partition.
 
   Input:
     - array (list)
       A list of values.
+    - lo (int)
+      The index of the first value to sort (defaults to the start of the array).
+    - hi (int)
+      The index after the last value to sort (defaults to the end of the array). Only array[lo:hi] is sorted, which lets other algorithms use insertion sort on small partitions.
+    - counters (Counters)
+      Counts the comparisons, swaps and passes made, if given (defaults to none). See instrumentation.py.
+    - binary (bool)
+      Whether to binary search for each value's sorted position, and shift the values after it with a slice assignment (defaults to false). The array must support slice assignment (e.g. lists and StaticArray).
   Output:
     - array (list)
       A list of sorted values.
@@ -180,15 +200,144 @@ def insertion_sort(array:list) -> None:
     - Worst-case
       O(1)
   """
-  for i in range(1, len(array)):
+  if hi is None:
+    hi = len(array)
+
+  if binary:
+    if counters is not None:
+      _binary_insertion_sort_counted(array, lo, hi, counters)
+    else:
+      binary_insertion_sort(array, lo, hi)
+    return
+
+  if counters is not None:
+    _insertion_sort_counted(array, lo, hi, counters)
+    return
+
+  for i in range(lo + 1, hi):
 
     j:int = i - 1
 
-    while (j >= 0) and (array[j + 1] < array[j]):
+    while (j >= lo) and (array[j + 1] < array[j]):
       
       swap(array, j + 1, j)
       j = j - 1
 
+def _insertion_sort_counted(array:list, lo:int, hi:int, counters:Counters) -> None:
+  # insertion_sort on array[lo:hi], with counters.
+  for i in range(lo + 1, hi):
+
+    counters.next_pass()
+    j:int = i - 1
+
+    while j >= lo:
+
+      counters.compare(j + 1, j)
+      if not (array[j + 1] < array[j]):
+        break
+
+      counters.swap(j + 1, j)
+      swap(array, j + 1, j)
+      j = j - 1
+
+def binary_insertion_sort(array:list, lo:int=0, hi:int=None) -> None:
+  """
+  Insertion sort, where each value's sorted position is found with a binary search, and the values after it are shifted with one slice assignment. Stable, since each value is inserted after any equal values.
+
+  Input:
+    - array (list)
+      A list of values, which supports slice assignment.
+    - lo (int)
+      The index of the first value to sort (defaults to the start of the array).
+    - hi (int)
+      The index after the last value to sort (defaults to the end of the array).
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n^2)
+    - Worst-case
+      O(n^2)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  if hi is None:
+    hi = len(array)
+
+  for i in range(lo + 1, hi):
+
+    value = array[i]
+
+    if value < array[i - 1]:
+
+      position:int = upper_bound(array, value, lo, i - 1)
+      array[position + 1:i + 1] = array[position:i]
+      array[position] = value
+
+def _binary_insertion_sort_counted(array:list, lo:int, hi:int, counters:Counters) -> None:
+  # binary_insertion_sort with counters; the binary search is written out so that its comparisons can be counted.
+  for i in range(lo + 1, hi):
+
+    counters.next_pass()
+    value = array[i]
+
+    counters.compare(i, i - 1)
+    if value < array[i - 1]:
+
+      low:int = lo
+      high:int = i - 1
+      while low < high:
+        mid:int = (low + high) // 2
+        counters.compare(i, mid)
+        if value < array[mid]:
+          high = mid
+        else:
+          low = mid + 1
+
+      counters.shift(low, i)
+      array[low + 1:i + 1] = array[low:i]
+      array[low] = value
+
+def insert_sorted(array:list, value:Any) -> int:
+  """
+  Inserts value into a sorted array, after any equal values, so that the array stays sorted.
+
+  Input:
+    - array (list)
+      A list of sorted values, which supports insert(i, value) (e.g. lists, DynamicArray and LinkedArray, which grow as needed, or StaticArray, which raises an exception once it is full; see below for LinkedArray).
+    - value
+      The value to insert.
+  Output:
+    - index (int)
+      The index value was inserted at.
+  Time Complexity:
+    - Best-case
+      O(log n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  (for random-access arrays; on a LinkedArray, each of the O(log n) probes of the binary search walks the links from the front, taking O(n) time, so every case takes O(n log n) time)
+  """
+  i:int = upper_bound(array, value)
+  array.insert(i, value)
+  return i
+
 def swap(array:list, i:int, j:int) -> None:
   """
   Swaps the value at index i with the value at index j for a given array.
@@ -224,4 +373,9 @@ if __name__ == "__main__":
   array = [3, 2, 1, 9, 4, 7, 6, 5, 8, 0]
   print(array)
   insertion_sort(array)
-  print(array)
\ No newline at end of file
+  print(array)
+
+  array = [3, 2, 1, 9, 4, 7, 6, 5, 8, 0]
+  insertion_sort(array, binary=True)
+  print(array)
+  print(insert_sorted(array, 5), array)
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Hi! This file defines counters for measuring how much work a sort did, i.e. how many comparisons, swaps, moves and passes it made, on real data, without editing the sort.
+Here's an example:
+
+  >> counters = Counters()
+  >> bubble_sort(array, counters=counters)
+  >> counters.comparisons, counters.swaps, counters.passes
+
+  - bubble_sort, selection_sort and insertion_sort each take an optional counters argument. When it is given, the sort calls counters.compare(i, j) before comparing array[i] with array[j], counters.swap(i, j) before swapping them, and counters.next_pass() at the start of each pass over the array (i.e. each iteration of the outer loop). Binary insertion sort shifts a block of values rather than swapping, and calls counters.shift(lo, hi) before moving array[lo:hi] one place to the right (which counts hi - lo + 1 moves, including the value inserted at lo).
+
+  - Counting costs a method call per comparison, which would slow every sort down if the sort checked whether counting was enabled inside its inner loop. Instead, each sort checks once, when it is called, and runs either its plain loop (which never touches the counters), or a separate instrumented copy of the loop. Thus, sorting without counters costs exactly what it did before.
+
+  - A tracer is an optional function that is called with every operation as it happens, e.g. tracer("compare", 8, 9), tracer("swap", 8, 9), tracer("shift", 2, 5) or tracer("pass", 0, None), which can be used to log or animate a sort.
+"""
+
+from typing import Callable
+
+class Counters():
+
+  def __init__(self, tracer:Callable=None) -> None:
+    self.comparisons:int = 0
+    self.swaps:int = 0
+    self.moves:int = 0
+    self.passes:int = 0
+    self.tracer = tracer
+
+  def compare(self, i:int, j:int) -> None:
+    self.comparisons += 1
+    if self.tracer is not None:
+      self.tracer("compare", i, j)
+
+  def swap(self, i:int, j:int) -> None:
+    self.swaps += 1
+    if self.tracer is not None:
+      self.tracer("swap", i, j)
+
+  def shift(self, lo:int, hi:int) -> None:
+    self.moves += hi - lo + 1
+    if self.tracer is not None:
+      self.tracer("shift", lo, hi)
+
+  def next_pass(self) -> None:
+    if self.tracer is not None:
+      self.tracer("pass", self.passes, None)
+    self.passes += 1
+
+  def reset(self) -> None:
+    self.comparisons = 0
+    self.swaps = 0
+    self.moves = 0
+    self.passes = 0
+
+  def __str__(self) -> str:
+    return "{} comparisons, {} swaps, {} moves, {} passes".format(self.comparisons, self.swaps, self.moves, self.passes)
@@ -0,0 +1,32 @@
+"""
+Hi! This file defines Keyed, a value decorated with the key it is sorted by, for sorting by a key function without calling the function inside the sort.
+Here's an example:
+
+  >> items = [Keyed(len(value), value) for value in ["pear", "fig"]]
+
+  - A Keyed object compares by its key only, so any sort in this folder can sort a list of them, and then the values are read back in their sorted order (undecorated). Since the value is never compared, values that can't be compared with each other (e.g. dicts) can still be sorted by key.
+
+  - It is shared by sort.py and radix_sort.py, and kept in its own file so that importing it doesn't import any of the sorts.
+"""
+
+from typing import Any
+
+class Keyed():
+  # A value decorated with its key, which compares by key only.
+  __slots__ = ("key", "value")
+
+  def __init__(self, key:Any, value:Any) -> None:
+    self.key = key
+    self.value = value
+
+  def __lt__(self, other:"Keyed") -> bool:
+    return self.key < other.key
+
+  def __gt__(self, other:"Keyed") -> bool:
+    return self.key > other.key
+
+  def __le__(self, other:"Keyed") -> bool:
+    return self.key <= other.key
+
+  def __ge__(self, other:"Keyed") -> bool:
+    return self.key >= other.key
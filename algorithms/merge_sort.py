@@ -0,0 +1,674 @@
+"""
+Hi! This file defines merge sort for arrays, a stable sorting algorithm that works by splitting an array into sorted runs, and then repeatedly merging pairs of adjacent runs into longer sorted runs until a single run covers the whole array.
+
+  - Recall insertion sort, which is very fast when the array is already (nearly) sorted, but takes O(n^2) time otherwise. Merge sort guarantees O(n log n) time, and the version here (a natural merge sort, in the style of Timsort) also takes advantage of any order that already exists in the array.
+
+  - Here's an example:
+
+    >>  array = [1, 2, 3, 9, 8, 7, 4, 5, 6, 0]
+
+    - A run is a sequence of values that are already in ascending order (or in strictly descending order, which is reversed in place to become ascending). Merge sort finds runs by walking over the array from the start.
+
+    >>  runs = [1, 2, 3, 9], [8, 7, 4], [5, 6], [0]
+
+    >>  runs = [1, 2, 3, 9], [4, 7, 8], [5, 6], [0]
+
+    - Note that descending runs must be strictly descending; reversing a run of equal values would swap their order, making the algorithm unstable.
+
+    - Runs that are too short are extended to a minimum length (minrun) with insertion sort, which is fast for small arrays. For the 10 values above, minrun covers the whole array, but for larger arrays, minrun is chosen between 32 and 64 so that the number of runs is (close to) a power of 2, which keeps the merges balanced.
+
+    - Runs are pushed onto a stack, and adjacent runs on the stack are merged whenever their lengths would otherwise stop shrinking geometrically. This keeps the stack short (O(log n) runs), and keeps each merge between runs of similar lengths.
+
+    merge([1, 2, 3, 9], [4, 7, 8]) -> [1, 2, 3, 4, 7, 8, 9]
+
+    - To merge two adjacent runs, the shorter run is copied into a temporary list, and the values are merged back into the array one at a time -- when values are equal, the value from the left run is always taken first, which keeps the algorithm stable.
+
+    - If one run keeps "winning" (i.e. many values in a row are taken from the same run), merge sort switches to galloping mode, where it uses an exponential search (1, 3, 7, 15, ...) followed by a binary search to find how many values can be taken from that run at once. This turns the merge of two runs that barely overlap into O(log n) comparisons, rather than O(n) comparisons.
+
+The best-case time complexity is O(n):
+
+  - If the array is already sorted (or reverse sorted), the whole array is a single run, which is found by comparing each pair of immediately adjacent values once. No merges are needed, and thus the best-case time complexity is O(n). Nearly sorted arrays are made up of a few long runs, and take close to O(n) time.
+
+The average/worst-case time complexity is O(n log n):
+
+  - Each merge takes time proportional to the lengths of the two runs being merged, and the merge policy guarantees that each value takes part in O(log n) merges. Defining 'n' as the number of values for a given array (i.e. the length of the array):
+
+  c * n * log(n) + c * n + c
+
+  - The greatest term is n * log(n), and thus the average/worst-case time complexity is O(n log n).
+
+The worst-case space complexity is O(n). Here's an explanation:
+
+  - Merging two runs requires a copy of the shorter run, which may include up to half of the values in the array. The run stack only holds O(log n) runs:
+
+  c * (n/2) + c * log(n) + c
+
+  - The greatest term is n, and thus the worst-case space complexity is O(n). In the best case (a single run), no merges are performed, and the space complexity is O(1).
+"""
+
+from insertion_sort import insertion_sort
+
+MIN_MERGE:int = 64
+MIN_GALLOP:int = 7
+
+def merge_sort(array:list) -> None:
+  """
+  A stable sorting algorithm that works by splitting an array into sorted runs, and then repeatedly merging pairs of adjacent runs into longer sorted runs until a single run covers the whole array. Works on anything that supports len() and integer indexing (e.g. lists, StaticArray and DynamicArray).
+
+  Input:
+    - array (list)
+      A list of values.
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  n:int = len(array)
+  if n < 2:
+    return
+
+  minrun:int = min_run_length(n)
+  runs:list = []
+  min_gallop:int = MIN_GALLOP
+
+  lo:int = 0
+  while lo < n:
+
+    run_length:int = count_run(array, lo, n)
+
+    if run_length < minrun:
+      forced:int = min(minrun, n - lo)
+      insertion_sort(array, lo, lo + forced)
+      run_length = forced
+
+    runs.append([lo, run_length])
+    min_gallop = merge_collapse(array, runs, min_gallop)
+    lo += run_length
+
+  merge_force_collapse(array, runs, min_gallop)
+
+def min_run_length(n:int) -> int:
+  """
+  Finds the minimum run length for an array of n values. If n is less than MIN_MERGE, this is n itself (i.e. the whole array is insertion sorted). Otherwise, it is a value between MIN_MERGE/2 and MIN_MERGE, where n/minrun is a power of 2 (or slightly less than one), which keeps the final merges balanced.
+
+  Input:
+    - n (int)
+      The number of values in the array.
+  Output:
+    - minrun (int)
+      The minimum run length.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  r:int = 0
+  while n >= MIN_MERGE:
+    r |= n & 1
+    n >>= 1
+  return n + r
+
+def count_run(array:list, lo:int, hi:int) -> int:
+  """
+  Finds the length of the run starting at index lo, where a run is either ascending (array[lo] <= array[lo+1] <= ...) or strictly descending (array[lo] > array[lo+1] > ...). Descending runs are reversed in place, so the run is always ascending when returned.
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the first value in the run.
+    - hi (int)
+      The index after the last value that may be included in the run.
+  Output:
+    - length (int)
+      The length of the (now ascending) run.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(k), where k is the length of the run
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  j:int = lo + 1
+  if j == hi:
+    return 1
+
+  if array[j] < array[lo]:
+    j += 1
+    while (j < hi) and (array[j] < array[j-1]):
+      j += 1
+    reverse(array, lo, j)
+  else:
+    j += 1
+    while (j < hi) and not (array[j] < array[j-1]):
+      j += 1
+
+  return j - lo
+
+def reverse(array:list, lo:int, hi:int) -> None:
+  """
+  Reverses the values of array[lo:hi] in place.
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the first value to reverse.
+    - hi (int)
+      The index after the last value to reverse.
+  Output:
+    - array (list)
+      A list where array[lo:hi] is reversed.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  hi -= 1
+  while lo < hi:
+    swap(array, lo, hi)
+    lo += 1
+    hi -= 1
+
+def merge_collapse(array:list, runs:list, min_gallop:int) -> int:
+  """
+  Merges adjacent runs on the run stack until the run lengths (read from the top of the stack down) grow at least as fast as the Fibonacci numbers, i.e. for the top three runs X, Y, Z (Z on top): len(X) > len(Y) + len(Z) and len(Y) > len(Z). This keeps the stack O(log n) runs deep and keeps merges balanced.
+
+  Input:
+    - array (list)
+      A list of values.
+    - runs (list)
+      The run stack, a list of [base, length] pairs of adjacent runs.
+    - min_gallop (int)
+      The current galloping threshold.
+  Output:
+    - min_gallop (int)
+      The updated galloping threshold.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  while len(runs) > 1:
+    i:int = len(runs) - 2
+    if ((i > 0) and (runs[i-1][1] <= runs[i][1] + runs[i+1][1])) or ((i > 1) and (runs[i-2][1] <= runs[i-1][1] + runs[i][1])):
+      if runs[i-1][1] < runs[i+1][1]:
+        i -= 1
+    elif runs[i][1] > runs[i+1][1]:
+      break
+    min_gallop = merge_at(array, runs, i, min_gallop)
+  return min_gallop
+
+def merge_force_collapse(array:list, runs:list, min_gallop:int) -> int:
+  """
+  Merges all runs on the run stack until a single run remains, which is then the whole sorted array.
+
+  Input:
+    - array (list)
+      A list of values.
+    - runs (list)
+      The run stack, a list of [base, length] pairs of adjacent runs.
+    - min_gallop (int)
+      The current galloping threshold.
+  Output:
+    - min_gallop (int)
+      The updated galloping threshold.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  while len(runs) > 1:
+    i:int = len(runs) - 2
+    if (i > 0) and (runs[i-1][1] < runs[i+1][1]):
+      i -= 1
+    min_gallop = merge_at(array, runs, i, min_gallop)
+  return min_gallop
+
+def merge_at(array:list, runs:list, i:int, min_gallop:int) -> int:
+  """
+  Merges the adjacent runs at positions i and i+1 of the run stack. Values at the start of the left run that are already less than or equal to the first value of the right run, and values at the end of the right run that are already greater than the last value of the left run, are in their sorted positions and are skipped before merging.
+
+  Input:
+    - array (list)
+      A list of values.
+    - runs (list)
+      The run stack, a list of [base, length] pairs of adjacent runs.
+    - i (int)
+      The position of the left run on the run stack.
+    - min_gallop (int)
+      The current galloping threshold.
+  Output:
+    - min_gallop (int)
+      The updated galloping threshold.
+  Time Complexity:
+    - Best-case
+      O(log n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  base1, length1 = runs[i]
+  base2, length2 = runs[i+1]
+
+  runs[i][1] = length1 + length2
+  del runs[i+1]
+
+  # Values in the left run that belong before array[base2] are already in place.
+  k:int = gallop_right(array[base2], array, base1, base1 + length1) - base1
+  base1 += k
+  length1 -= k
+  if length1 == 0:
+    return min_gallop
+
+  # Values in the right run that belong after array[base1 + length1 - 1] are already in place.
+  length2 = gallop_left(array[base1 + length1 - 1], array, base2, base2 + length2, True) - base2
+  if length2 == 0:
+    return min_gallop
+
+  if length1 <= length2:
+    return merge_lo(array, base1, length1, base2, length2, min_gallop)
+  return merge_hi(array, base1, length1, base2, length2, min_gallop)
+
+def merge_lo(array:list, base1:int, length1:int, base2:int, length2:int, min_gallop:int) -> int:
+  """
+  Merges two adjacent runs, where the left run is the shorter of the two, by copying the left run into a temporary list and merging from the start of both runs. Switches to galloping mode when one run wins min_gallop times in a row.
+
+  Input:
+    - array (list)
+      A list of values.
+    - base1, length1 (int)
+      The start index and length of the left run.
+    - base2, length2 (int)
+      The start index and length of the right run.
+    - min_gallop (int)
+      The current galloping threshold.
+  Output:
+    - min_gallop (int)
+      The updated galloping threshold.
+  Time Complexity:
+    - Best-case
+      O(log n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  temp:list = [array[k] for k in range(base1, base1 + length1)]
+  i:int = 0
+  j:int = base2
+  end:int = base2 + length2
+  dest:int = base1
+
+  while (i < length1) and (j < end):
+
+    count1:int = 0
+    count2:int = 0
+
+    # Take values one at a time, until one run wins min_gallop times in a row.
+    while (i < length1) and (j < end):
+      if array[j] < temp[i]:
+        array[dest] = array[j]
+        j += 1
+        count2 += 1
+        count1 = 0
+      else:
+        array[dest] = temp[i]
+        i += 1
+        count1 += 1
+        count2 = 0
+      dest += 1
+      if (count1 >= min_gallop) or (count2 >= min_gallop):
+        break
+
+    # Gallop, taking blocks of values at a time, until galloping stops paying off.
+    while (i < length1) and (j < end):
+      if min_gallop > 1:
+        min_gallop -= 1
+
+      count1 = gallop_right(array[j], temp, i, length1) - i
+      for _ in range(count1):
+        array[dest] = temp[i]
+        i += 1
+        dest += 1
+      if i == length1:
+        break
+
+      count2 = gallop_left(temp[i], array, j, end) - j
+      for _ in range(count2):
+        array[dest] = array[j]
+        j += 1
+        dest += 1
+
+      if (count1 < MIN_GALLOP) and (count2 < MIN_GALLOP):
+        min_gallop += 2
+        break
+
+  # The rest of the right run is already in place.
+  while i < length1:
+    array[dest] = temp[i]
+    i += 1
+    dest += 1
+
+  return min_gallop
+
+def merge_hi(array:list, base1:int, length1:int, base2:int, length2:int, min_gallop:int) -> int:
+  """
+  Merges two adjacent runs, where the right run is the shorter of the two, by copying the right run into a temporary list and merging from the end of both runs. Switches to galloping mode when one run wins min_gallop times in a row.
+
+  Input:
+    - array (list)
+      A list of values.
+    - base1, length1 (int)
+      The start index and length of the left run.
+    - base2, length2 (int)
+      The start index and length of the right run.
+    - min_gallop (int)
+      The current galloping threshold.
+  Output:
+    - min_gallop (int)
+      The updated galloping threshold.
+  Time Complexity:
+    - Best-case
+      O(log n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  temp:list = [array[k] for k in range(base2, base2 + length2)]
+  i:int = base1 + length1 - 1
+  j:int = length2 - 1
+  dest:int = base2 + length2 - 1
+
+  while (i >= base1) and (j >= 0):
+
+    count1:int = 0
+    count2:int = 0
+
+    # Take values one at a time, until one run wins min_gallop times in a row.
+    while (i >= base1) and (j >= 0):
+      if temp[j] < array[i]:
+        array[dest] = array[i]
+        i -= 1
+        count1 += 1
+        count2 = 0
+      else:
+        array[dest] = temp[j]
+        j -= 1
+        count2 += 1
+        count1 = 0
+      dest -= 1
+      if (count1 >= min_gallop) or (count2 >= min_gallop):
+        break
+
+    # Gallop, taking blocks of values at a time, until galloping stops paying off.
+    while (i >= base1) and (j >= 0):
+      if min_gallop > 1:
+        min_gallop -= 1
+
+      count1 = i + 1 - gallop_right(temp[j], array, base1, i + 1, True)
+      for _ in range(count1):
+        array[dest] = array[i]
+        i -= 1
+        dest -= 1
+      if i < base1:
+        break
+
+      count2 = j + 1 - gallop_left(array[i], temp, 0, j + 1, True)
+      for _ in range(count2):
+        array[dest] = temp[j]
+        j -= 1
+        dest -= 1
+
+      if (count1 < MIN_GALLOP) and (count2 < MIN_GALLOP):
+        min_gallop += 2
+        break
+
+  # The rest of the left run is already in place.
+  while j >= 0:
+    array[dest] = temp[j]
+    j -= 1
+    dest -= 1
+
+  return min_gallop
+
+def gallop_left(key, array:list, lo:int, hi:int, from_right:bool=False) -> int:
+  """
+  Finds the first index in the sorted array[lo:hi] where array[index] >= key (i.e. where key would be inserted before any equal values). Uses an exponential search from one end (1, 3, 7, 15, ... values in), followed by a binary search, so it is fast when the answer is close to that end.
+
+  Input:
+    - key
+      The value to search for.
+    - array (list)
+      A list of sorted values.
+    - lo (int)
+      The index of the first value to search.
+    - hi (int)
+      The index after the last value to search.
+    - from_right (bool)
+      Whether to start the exponential search from the end (hi) rather than the start (lo).
+  Output:
+    - index (int)
+      The insertion index, between lo and hi.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log k), where k is the distance of the answer from the starting end
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  n:int = hi - lo
+  last:int = -1
+  offset:int = 0
+
+  if not from_right:
+    while (offset < n) and (array[lo + offset] < key):
+      last = offset
+      offset = 2 * offset + 1
+    low:int = lo + last + 1
+    high:int = lo + min(offset, n)
+  else:
+    while (offset < n) and not (array[hi - 1 - offset] < key):
+      last = offset
+      offset = 2 * offset + 1
+    low = hi - min(offset, n)
+    high = hi - 1 - last
+
+  while low < high:
+    mid:int = (low + high) // 2
+    if array[mid] < key:
+      low = mid + 1
+    else:
+      high = mid
+  return low
+
+def gallop_right(key, array:list, lo:int, hi:int, from_right:bool=False) -> int:
+  """
+  Finds the first index in the sorted array[lo:hi] where array[index] > key (i.e. where key would be inserted after any equal values). Uses an exponential search from one end (1, 3, 7, 15, ... values in), followed by a binary search, so it is fast when the answer is close to that end.
+
+  Input:
+    - key
+      The value to search for.
+    - array (list)
+      A list of sorted values.
+    - lo (int)
+      The index of the first value to search.
+    - hi (int)
+      The index after the last value to search.
+    - from_right (bool)
+      Whether to start the exponential search from the end (hi) rather than the start (lo).
+  Output:
+    - index (int)
+      The insertion index, between lo and hi.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log k), where k is the distance of the answer from the starting end
+    - Worst-case
+      O(log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  n:int = hi - lo
+  last:int = -1
+  offset:int = 0
+
+  if not from_right:
+    while (offset < n) and not (key < array[lo + offset]):
+      last = offset
+      offset = 2 * offset + 1
+    low:int = lo + last + 1
+    high:int = lo + min(offset, n)
+  else:
+    while (offset < n) and (key < array[hi - 1 - offset]):
+      last = offset
+      offset = 2 * offset + 1
+    low = hi - min(offset, n)
+    high = hi - 1 - last
+
+  while low < high:
+    mid:int = (low + high) // 2
+    if key < array[mid]:
+      high = mid
+    else:
+      low = mid + 1
+  return low
+
+def swap(array:list, i:int, j:int) -> None:
+  """
+  Swaps the value at index i with the value at index j for a given array.
+
+  Input:
+    - array (list)
+      A list of values.
+    - i (int)
+      The index of the first value.
+    - j (int)
+      The index of the second value.
+  Output:
+    - array (list)
+      A list where the values at i and j are swapped.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  item = array[i]
+  array[i] = array[j]
+  array[j] = item
+
+
+if __name__ == "__main__":
+
+  array = [1, 2, 3, 9, 8, 7, 4, 5, 6, 0]
+  print(array)
+  merge_sort(array)
+  print(array)
@@ -0,0 +1,288 @@
+"""
+Hi! This file defines parallel sort, which sorts a large array of numbers on several CPU cores at once, by sorting chunks of the array in separate processes and then merging them.
+
+  - Every other sort in this folder runs in a single Python process, which only ever uses one CPU core. Python threads don't help, since only one thread can run Python code at a time, so parallel sort uses a pool of worker processes instead.
+
+  - Sending a list to another process normally means pickling (copying) every value. Instead, the numbers are copied once into a block of shared memory (see multiprocessing.shared_memory), as raw 64-bit integers or floats, and every worker reads and writes the block directly. Only the block's name and the indices a worker should look at are sent to it.
+
+  - Here's an example (with 2 workers):
+
+    >>  array = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+
+    - First, the array is split into chunks (one per worker by default), and each worker sorts its chunk in place in the shared block (with radix sort for integers, or quick sort for floats).
+
+    >>  array = [0, 2, 3, 4, 9, 1, 5, 6, 7, 8]
+        chunks = [0, 2, 3, 4, 9], [1, 5, 6, 7, 8]
+
+    - Then the chunks are combined with sample sort partitioning. A few evenly spaced values (samples) are taken from every sorted chunk, and sorted, and workers - 1 of them are chosen as splitters, which divide the values into one partition per worker. Since each chunk is sorted, a binary search finds where each splitter falls in each chunk.
+
+    splitters = [5]
+    partition 0 = [0, 2, 3, 4] + [1]        (values < 5)
+    partition 1 = [9] + [5, 6, 7, 8]        (values >= 5)
+
+    - Each worker k-way merges the pieces of its own partition (with a heap), and writes the result straight into its final position in a second shared block; partition 0 starts at index 0, partition 1 starts after the values of partition 0, and so on. No worker ever waits for another.
+
+    >>  array = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+  - Starting processes and copying the array into shared memory takes time, so arrays of fewer than threshold values are sorted serially instead. Arrays of values that aren't all integers or all floats (e.g. strings) are also sorted serially, with sort() (see sort.py).
+
+The best/average/worst-case time complexity is O((n log n) / p):
+
+  - Defining 'n' as the number of values, and 'p' as the number of workers, each worker sorts n / p values, and then merges about n / p values from p pieces.
+
+  c * (n/p) * log(n/p) + c * (n/p) * log(p) + c * n
+
+  - The c * n term is copying the array into and out of shared memory, which is done by the calling process, but in large blocks.
+
+The best/average/worst-case space complexity is O(n). Here's an explanation:
+
+  - The two shared blocks each hold a copy of the array.
+
+  c * n + c
+
+  - The greatest term is n, and thus the space complexity is O(n).
+"""
+
+import heapq
+import os
+from array import array as typed_array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any
+from quick_sort import quick_sort
+from radix_sort import radix_sort
+from sort import sort
+
+SERIAL_THRESHOLD:int = 1 << 17
+SAMPLES_PER_CHUNK:int = 32
+INTEGER_TYPECODES:str = "bBhHiIlLqQ"
+
+def parallel_sort(array:list, workers:int=None, chunk_size:int=None, threshold:int=SERIAL_THRESHOLD) -> None:
+  """
+  Sorts an array of numbers in place, by sorting chunks of it in a pool of worker processes (with the values in shared memory), and then merging the chunks with sample sort partitioning.
+
+  Input:
+    - array (list)
+      A list of integers or floats, or a typed StaticArray or DynamicArray (e.g. StaticArray(n, typecode="q")).
+    - workers (int)
+      The number of worker processes (defaults to the number of CPU cores).
+    - chunk_size (int)
+      The number of values each worker sorts at a time (defaults to len(array) / workers, i.e. one chunk per worker).
+    - threshold (int)
+      The smallest array that is sorted in parallel (defaults to 2^17); smaller arrays are sorted serially.
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O((n log n) / p)
+    - Average-case
+      O((n log n) / p)
+    - Worst-case
+      O((n log n) / p)
+  Space Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  n:int = len(array)
+  if workers is None:
+    workers = os.cpu_count() or 1
+  typecode:str = numeric_typecode(array)
+
+  if (typecode is None) or (workers < 2) or (n < max(threshold, 2)):
+    if typecode is None:
+      sort(array, stable=False)
+    elif isinstance(array, list):
+      serial_sort(array, typecode)
+    else:
+      values:list = serial_sort(list(array), typecode)
+      array[0:n] = values
+    return
+
+  if chunk_size is None:
+    chunk_size = -(-n // workers)
+  chunks:list = [(lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size)]
+  itemsize:int = typed_array(typecode).itemsize
+
+  view:memoryview = None
+  result:memoryview = None
+  source = shared_memory.SharedMemory(create=True, size=n * itemsize)
+  try:
+    target = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    try:
+      view = _view(source, typecode, n)
+      if isinstance(array, list):
+        view[:] = typed_array(typecode, array)
+      else:
+        _copy(view, array)
+
+      with ProcessPoolExecutor(workers) as pool:
+        list(pool.map(_sort_chunk, [(source.name, typecode, n, lo, hi) for lo, hi in chunks]))
+
+        splitters:list = choose_splitters(view, chunks, workers)
+        tasks:list = []
+        start:int = 0
+        for lo_cuts, hi_cuts in _partitions(view, chunks, splitters):
+          ranges:list = list(zip(lo_cuts, hi_cuts))
+          tasks.append((source.name, target.name, typecode, n, ranges, start))
+          start += sum(hi - lo for lo, hi in ranges)
+        list(pool.map(_merge_partition, tasks))
+
+      result = _view(target, typecode, n)
+      if isinstance(array, list):
+        array[:] = result.tolist()
+      else:
+        _copy(array, result)
+    finally:
+      # A segment can't be closed while a view of it still exists, so the views are released first (even if sorting failed).
+      if result is not None:
+        result.release()
+      if view is not None:
+        view.release()
+      try:
+        target.close()
+      finally:
+        target.unlink()
+  finally:
+    try:
+      source.close()
+    finally:
+      source.unlink()
+
+def numeric_typecode(array:list) -> str:
+  """
+  Finds the typecode (see the array module) that the values of an array can be stored in without changing them; "q" (64-bit integers) or "d" (64-bit floats) for a list, or the array's own typecode for a typed StaticArray or DynamicArray.
+
+  Input:
+    - array (list)
+      A list of values, or a StaticArray or DynamicArray.
+  Output:
+    - typecode (str)
+      The typecode, or None if the values aren't all integers (that fit in 64 bits) or all floats.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  if not isinstance(array, list):
+    # A StaticArray or DynamicArray, which is only typed if it was given a typecode.
+    typecode:str = getattr(array, "typecode", None)
+    if (typecode is None) or (typecode not in INTEGER_TYPECODES + "fd"):
+      return None
+    return typecode
+  if all(type(value) is int for value in array):
+    if array and ((min(array) < -(1 << 63)) or (max(array) >= (1 << 63))):
+      return None
+    return "q"
+  if all(type(value) is float for value in array):
+    return "d"
+  return None
+
+def serial_sort(values:list, typecode:str) -> list:
+  # Sorts a list of numbers of the given typecode in place (and returns it), with the fastest serial sort for that type.
+  if typecode in INTEGER_TYPECODES:
+    radix_sort(values)
+  else:
+    quick_sort(values)
+  return values
+
+def choose_splitters(view:memoryview, chunks:list, workers:int) -> list:
+  """
+  Chooses workers - 1 splitters that divide the values of the sorted chunks into partitions of about the same size, from SAMPLES_PER_CHUNK evenly spaced values of each chunk.
+
+  Input:
+    - view (memoryview)
+      The values, where each chunk is sorted.
+    - chunks (list)
+      The (lo, hi) index ranges of the chunks.
+    - workers (int)
+      The number of partitions.
+  Output:
+    - splitters (list)
+      A sorted list of workers - 1 values.
+  Time Complexity:
+    - Best-case
+      O(c log c)
+    - Average-case
+      O(c log c)
+    - Worst-case
+      O(c log c)
+  Space Complexity:
+    - Best-case
+      O(c)
+    - Average-case
+      O(c)
+    - Worst-case
+      O(c)
+  (where c is the number of samples)
+  """
+  samples:list = []
+  for lo, hi in chunks:
+    for k in range(SAMPLES_PER_CHUNK):
+      samples.append(view[lo + (hi - lo) * k // SAMPLES_PER_CHUNK])
+  quick_sort(samples)
+  return [samples[len(samples) * k // workers] for k in range(1, workers)]
+
+def _partitions(view:memoryview, chunks:list, splitters:list) -> list:
+  # For each partition, the indices in each chunk where it starts and ends (found by binary searching each sorted chunk for the splitters).
+  cuts:list = []
+  for lo, hi in chunks:
+    cuts.append([lo] + [bisect_left(view, splitter, lo, hi) for splitter in splitters] + [hi])
+  return [([cut[k] for cut in cuts], [cut[k + 1] for cut in cuts]) for k in range(len(splitters) + 1)]
+
+def _copy(target:Any, source:Any) -> None:
+  # Copies between a shared block's view and a typed array's memoryview, releasing the array's view afterwards so the array can be resized again.
+  if isinstance(target, memoryview):
+    array_view:memoryview = source.memoryview()
+    target[:] = array_view
+  else:
+    array_view = target.memoryview()
+    array_view[:] = source
+  array_view.release()
+
+def _view(block:shared_memory.SharedMemory, typecode:str, n:int) -> memoryview:
+  # The block may be rounded up to a whole number of pages, so only its first n values are viewed.
+  return block.buf[:n * typed_array(typecode).itemsize].cast(typecode)
+
+def _sort_chunk(task:tuple) -> None:
+  name, typecode, n, lo, hi = task
+  block = shared_memory.SharedMemory(name)
+  view:memoryview = _view(block, typecode, n)
+  view[lo:hi] = typed_array(typecode, serial_sort(view[lo:hi].tolist(), typecode))
+  view.release()
+  block.close()
+
+def _merge_partition(task:tuple) -> None:
+  source_name, target_name, typecode, n, ranges, start = task
+  source = shared_memory.SharedMemory(source_name)
+  target = shared_memory.SharedMemory(target_name)
+  source_view:memoryview = _view(source, typecode, n)
+  target_view:memoryview = _view(target, typecode, n)
+  merged:typed_array = typed_array(typecode, heapq.merge(*[source_view[lo:hi].tolist() for lo, hi in ranges]))
+  target_view[start:start + len(merged)] = merged
+  source_view.release()
+  target_view.release()
+  source.close()
+  target.close()
+
+if __name__ == "__main__":
+
+  array = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+  print(array)
+  parallel_sort(array, workers=2, threshold=0)
+  print(array)
@@ -0,0 +1,323 @@
+"""
+Hi! This file defines quick sort for arrays, an unstable sorting algorithm that works by choosing a pivot value, partitioning the array around it (values less than the pivot, equal to the pivot, and greater than the pivot), and then sorting each partition the same way.
+
+  - Recall merge sort, which guarantees O(n log n) time, but needs O(n) auxiliary space to merge runs. Quick sort is in-place; the partitioning only ever swaps values within the array.
+
+  - Here's an example:
+
+    >>  array = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+
+    - The pivot is chosen as the median of three values (the first, middle, and last values of the partition), or for larger partitions, the median of three such medians (Tukey's ninther). This makes it very unlikely that the pivot is one of the smallest or largest values, even when the array is already sorted.
+
+    pivot = median(3, 4, 1) = 3
+
+    - The pivot is swapped to the start of the partition, and the partition is then split in three with a single pass (the "Dutch national flag" partition), where lt marks the end of the values less than the pivot, gt marks the start of the values greater than the pivot, and i walks over the unpartitioned values between them.
+
+    while i <= gt:
+
+      if array[i] < pivot:
+        swap(array, lt, i)
+        lt = lt + 1
+        i = i + 1
+
+      elif array[i] > pivot:
+        swap(array, i, gt)
+        gt = gt - 1
+
+      else:
+        i = i + 1
+
+    >>  array = [0, 2, 1, 3, 7, 6, 5, 8, 4, 9]
+      less than = [0, 2, 1]
+       equal to =          [3]
+   greater than =             [7, 6, 5, 8, 4, 9]
+
+    - Notice that the values equal to the pivot are now in their sorted positions, and are never looked at again. This is what keeps arrays with only a few distinct values from taking O(n^2) time; a two-way partition would keep re-partitioning the equal values.
+
+    - The smaller of the two remaining partitions is sorted recursively, and the larger one is sorted by looping. Since the smaller partition holds at most half of the values, the recursion is at most O(log n) deep.
+
+    - Partitions with only a few values are sorted with insertion sort, which is faster than quick sort for small arrays.
+
+  - This version of quick sort is an introsort (introspective sort); it counts how many times it has partitioned, and if this goes past 2 * log2(n) (which only happens when the pivots keep being poor), it switches to heap sort for that partition. Heap sort is always O(n log n), so quick sort can never degrade to O(n^2).
+
+  - Quick sort is unstable; a swap during partitioning can move a value past other values that are equal to it.
+
+The best-case time complexity is O(n):
+
+  - If all values are equal, the first partition puts every value into the "equal to" part in a single pass, and there is nothing left to sort.
+
+The average/worst-case time complexity is O(n log n):
+
+  - Each level of partitioning takes O(n) time over all partitions, and a reasonable pivot roughly halves the partitions at each level, giving O(log n) levels. Defining 'n' as the number of values for a given array (i.e. the length of the array):
+
+  c * n * log(n) + c * n + c
+
+  - If the pivots keep being poor, introsort switches to heap sort after 2 * log2(n) levels, which is also O(n log n). The greatest term is n * log(n), and thus the average/worst-case time complexity is O(n log n).
+
+The best/average/worst-case space complexity is O(log n). Here's an explanation:
+
+  - Quick sort is in-place, but recursing on the smaller partition uses one stack frame per level, and there are at most log2(n) such levels:
+
+  c * log(n) + c
+
+  - The greatest term is log(n), and thus the space complexity is O(log n).
+"""
+
+from insertion_sort import insertion_sort
+from heap_sort import heap_sort
+
+INSERTION_THRESHOLD:int = 16
+NINTHER_THRESHOLD:int = 128
+
+def quick_sort(array:list) -> None:
+  """
+  An unstable sorting algorithm that works by choosing a pivot value, partitioning the array around it (values less than the pivot, equal to the pivot, and greater than the pivot), and then sorting each partition the same way. Switches to heap sort if the partitioning goes too deep, and to insertion sort for small partitions.
+
+  Input:
+    - array (list)
+      A list of values.
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  """
+  n:int = len(array)
+  if n < 2:
+    return
+  introsort(array, 0, n, 2 * (n.bit_length() - 1))
+
+def introsort(array:list, lo:int, hi:int, depth:int) -> None:
+  """
+  Sorts array[lo:hi] with quick sort, recursing on the smaller partition and looping on the larger one. Once depth reaches 0, the rest of the partition is sorted with heap sort.
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the first value to sort.
+    - hi (int)
+      The index after the last value to sort.
+    - depth (int)
+      The number of partitioning levels left before switching to heap sort.
+  Output:
+    - array (list)
+      A list where array[lo:hi] is sorted.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(log n)
+    - Worst-case
+      O(log n)
+  """
+  while hi - lo > INSERTION_THRESHOLD:
+
+    if depth == 0:
+      heap_sort(array, lo, hi)
+      return
+    depth -= 1
+
+    swap(array, lo, choose_pivot(array, lo, hi))
+    lt, gt = partition(array, lo, hi)
+
+    if lt - lo < hi - gt:
+      introsort(array, lo, lt, depth)
+      lo = gt
+    else:
+      introsort(array, gt, hi, depth)
+      hi = lt
+
+  insertion_sort(array, lo, hi)
+
+def choose_pivot(array:list, lo:int, hi:int) -> int:
+  """
+  Chooses the index of a pivot for array[lo:hi]; the median of the first, middle and last values, or for partitions of at least NINTHER_THRESHOLD values, the median of three such medians taken from evenly spaced positions (Tukey's ninther).
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the first value of the partition.
+    - hi (int)
+      The index after the last value of the partition.
+  Output:
+    - index (int)
+      The index of the pivot.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  last:int = hi - 1
+  mid:int = (lo + last) // 2
+
+  if hi - lo < NINTHER_THRESHOLD:
+    return median_of_three(array, lo, mid, last)
+
+  step:int = (hi - lo) // 8
+  return median_of_three(
+    array,
+    median_of_three(array, lo, lo + step, lo + 2*step),
+    median_of_three(array, mid - step, mid, mid + step),
+    median_of_three(array, last - 2*step, last - step, last)
+  )
+
+def median_of_three(array:list, i:int, j:int, k:int) -> int:
+  """
+  Finds the index of the median of the values at indices i, j and k.
+
+  Input:
+    - array (list)
+      A list of values.
+    - i, j, k (int)
+      The indices of the three values.
+  Output:
+    - index (int)
+      Whichever of i, j and k holds the median value.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  if array[i] < array[j]:
+    if array[j] < array[k]:
+      return j
+    if array[i] < array[k]:
+      return k
+    return i
+  if array[i] < array[k]:
+    return i
+  if array[j] < array[k]:
+    return k
+  return j
+
+def partition(array:list, lo:int, hi:int) -> tuple:
+  """
+  Partitions array[lo:hi] in three around the pivot at array[lo] (the "Dutch national flag" partition), so that array[lo:lt] < pivot, array[lt:gt] == pivot, and array[gt:hi] > pivot.
+
+  Input:
+    - array (list)
+      A list of values.
+    - lo (int)
+      The index of the pivot, which is the first value of the partition.
+    - hi (int)
+      The index after the last value of the partition.
+  Output:
+    - lt, gt (tuple)
+      The start and end (exclusive) of the values equal to the pivot.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  pivot = array[lo]
+  lt:int = lo
+  i:int = lo + 1
+  gt:int = hi - 1
+
+  while i <= gt:
+
+    if array[i] < pivot:
+      swap(array, lt, i)
+      lt += 1
+      i += 1
+
+    elif pivot < array[i]:
+      swap(array, i, gt)
+      gt -= 1
+
+    else:
+      i += 1
+
+  return lt, gt + 1
+
+def swap(array:list, i:int, j:int) -> None:
+  """
+  Swaps the value at index i with the value at index j for a given array.
+
+  Input:
+    - array (list)
+      A list of values.
+    - i (int)
+      The index of the first value.
+    - j (int)
+      The index of the second value.
+  Output:
+    - array (list)
+      A list where the values at i and j are swapped.
+  Time Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  item = array[i]
+  array[i] = array[j]
+  array[j] = item
+
+
+if __name__ == "__main__":
+
+  array = [3, 0, 2, 9, 4, 7, 6, 5, 8, 1]
+  print(array)
+  quick_sort(array)
+  print(array)
@@ -0,0 +1,311 @@
+"""
+Hi! This file defines counting sort and radix sort, stable sorting algorithms that never compare two values with each other; instead, they sort integers by their digits, and strings by their characters.
+
+  - Recall that every comparison-based sort (bubble sort, insertion sort, merge sort, quick sort, heap sort, ...) must make O(n log n) comparisons in the worst case, since each comparison only has two outcomes. When the values are integers in a known range, or strings, a value's position can be worked out from the value itself, without comparing it to anything.
+
+  - Counting sort works on integers between lo and hi. It counts how many times each integer occurs (a histogram), and then a running total of the counts (a prefix sum) gives the position where each integer's values start in the sorted array. This takes O(n + (hi - lo)) time, which is only worthwhile when the range is not much larger than n.
+
+  - Here's an example:
+
+    >>  array = [3, 0, 2, 3, 1, 0]
+
+    counts = [2, 1, 1, 2]  (two 0s, one 1, one 2, two 3s)
+    starts = [0, 2, 3, 4]  (0s start at index 0, 1s at index 2, ...)
+
+    >>  array = [0, 0, 1, 2, 3, 3]
+
+  - LSD (least significant digit) radix sort works on any integers. It splits each integer into digits of 8 (or 16) bits, and stably sorts the whole array by one digit at a time, starting from the least significant digit, by distributing the values into one bucket per possible digit. Since each pass is stable, values with equal digits keep the order from the previous passes, so after the last (most significant) digit, the array is sorted. Sorting integers of w bits takes w/8 passes of O(n) time, regardless of n.
+
+    >>  array = [0x1234, 0x0a01, 0x12ff, 0x0a34]
+
+    sorted by the low byte   = [0x0a01, 0x1234, 0x0a34, 0x12ff]
+    sorted by the high byte  = [0x0a01, 0x0a34, 0x1234, 0x12ff]
+
+    - Negative integers are handled by subtracting the minimum value first, so every digit is non-negative. Passes stop once the remaining digits of every value are zero, and a pass where every value has the same digit leaves the order as it was.
+
+  - MSD (most significant digit) radix sort works on strings and bytes. It distributes the values into buckets by their first character, then sorts each bucket by the second character, and so on. Values that end before the current character go before every bucket (e.g. "ab" < "abc"), and buckets with only a few values are finished off with binary insertion sort, which is faster for them than another round of bucketing.
+
+  - When NumPy is installed, radix_sort sorts large arrays of integers with whole-array operations rather than a Python loop per value; each pass computes the digits of every value at once, and NumPy's stable argsort (which is itself a counting sort for 8 and 16-bit digits) finds where each value goes. Without NumPy, the pure Python version is used.
+
+  - All three sorts are stable, and take an optional key function, which is called once per value.
+
+The best/average/worst-case time complexity is O(w * n):
+
+  - Defining 'n' as the number of values, and 'w' as the number of digits in the largest value (or characters in the longest string), each of the w passes takes O(n) time (plus O(2^bits) time to set up the buckets).
+
+  c * w * n + c
+
+  - For integers of a fixed size, w is a constant, and the time complexity is O(n).
+
+The best/average/worst-case space complexity is O(n). Here's an explanation:
+
+  - The buckets hold every value during each pass.
+
+  c * n + c * 2^bits + c
+
+  - The greatest term is n, and thus the space complexity is O(n).
+"""
+
+from typing import Callable
+from insertion_sort import binary_insertion_sort
+from keyed import Keyed
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+NUMPY_THRESHOLD:int = 1 << 12
+MSD_INSERTION_THRESHOLD:int = 32
+
+def counting_sort(array:list, key:Callable=None) -> None:
+  """
+  A stable sorting algorithm for integers, which counts how many times each integer occurs, and uses the running totals of the counts to place each value directly in its sorted position.
+
+  Input:
+    - array (list)
+      A list of integers (or of values whose key is an integer).
+    - key (Callable)
+      A function applied to each value once, to find the integer it is sorted by (defaults to none, i.e. the values themselves).
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(n + k)
+    - Average-case
+      O(n + k)
+    - Worst-case
+      O(n + k)
+  Space Complexity:
+    - Best-case
+      O(n + k)
+    - Average-case
+      O(n + k)
+    - Worst-case
+      O(n + k)
+  (where k is the difference between the largest and smallest integer)
+  """
+  n:int = len(array)
+  if n < 2:
+    return
+
+  keys:list = [array[i] for i in range(n)] if key is None else [key(array[i]) for i in range(n)]
+  lo:int = min(keys)
+  counts:list = [0] * (max(keys) - lo + 1)
+  for k in keys:
+    counts[k - lo] += 1
+
+  total:int = 0
+  for offset in range(len(counts)):
+    counts[offset], total = total, total + counts[offset]
+
+  result:list = [None] * n
+  for i in range(n):
+    position:int = counts[keys[i] - lo]
+    result[position] = array[i]
+    counts[keys[i] - lo] = position + 1
+  _write_back(array, result)
+
+def radix_sort(array:list, key:Callable=None, bits:int=None) -> None:
+  """
+  A stable sorting algorithm for integers (LSD radix sort), which sorts the array by one digit of bits bits at a time, from the least significant digit to the most significant.
+
+  Input:
+    - array (list)
+      A list of integers (or of values whose key is an integer).
+    - key (Callable)
+      A function applied to each value once, to find the integer it is sorted by (defaults to none, i.e. the values themselves).
+    - bits (int)
+      The number of bits per digit (defaults to 8, or 16 for arrays of more than 2^16 values, where fewer passes outweigh the cost of 2^16 buckets).
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(w * n)
+    - Average-case
+      O(w * n)
+    - Worst-case
+      O(w * n)
+  Space Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  n:int = len(array)
+  if n < 2:
+    return
+  if bits is None:
+    bits = 16 if n > (1 << 16) else 8
+
+  if (numpy is not None) and (key is None) and (n >= NUMPY_THRESHOLD) and _radix_sort_numpy(array, bits):
+    return
+
+  base:int = 1 << bits
+  mask:int = base - 1
+
+  if key is None:
+    values:list = [array[i] for i in range(n)]
+    lo:int = min(values)
+    span:int = max(values) - lo
+    shift:int = 0
+    while (span >> shift) > 0:
+      buckets:list = [[] for _ in range(base)]
+      for value in values:
+        buckets[((value - lo) >> shift) & mask].append(value)
+      if not _same_bucket(buckets, n):
+        values = [value for bucket in buckets for value in bucket]
+      shift += bits
+    _write_back(array, values)
+    return
+
+  keys:list = [key(array[i]) for i in range(n)]
+  lo = min(keys)
+  span = max(keys) - lo
+  order:list = list(range(n))
+  shift = 0
+  while (span >> shift) > 0:
+    buckets = [[] for _ in range(base)]
+    for i in order:
+      buckets[((keys[i] - lo) >> shift) & mask].append(i)
+    if not _same_bucket(buckets, n):
+      order = [i for bucket in buckets for i in bucket]
+    shift += bits
+  _write_back(array, [array[i] for i in order])
+
+def msd_radix_sort(array:list, key:Callable=None) -> None:
+  """
+  A stable sorting algorithm for strings and bytes (MSD radix sort), which distributes the values into buckets by their first character, and then sorts each bucket by the next character, and so on.
+
+  Input:
+    - array (list)
+      A list of strings or bytes (or of values whose key is a string or bytes).
+    - key (Callable)
+      A function applied to each value once, to find the string it is sorted by (defaults to none, i.e. the values themselves).
+  Output:
+    - array (list)
+      A list of sorted values.
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(w * n)
+    - Worst-case
+      O(w * n)
+  Space Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  n:int = len(array)
+  if n < 2:
+    return
+
+  items:list = [Keyed(array[i] if key is None else key(array[i]), array[i]) for i in range(n)]
+
+  # Each entry is a range [lo, hi) of items that share their first depth characters.
+  stack:list = [(0, n, 0)]
+  while stack:
+    lo, hi, depth = stack.pop()
+
+    if hi - lo <= MSD_INSERTION_THRESHOLD:
+      binary_insertion_sort(items, lo, hi)
+      continue
+
+    ended:list = []
+    buckets:dict = {}
+    for i in range(lo, hi):
+      item:Keyed = items[i]
+      if len(item.key) == depth:
+        ended.append(item)
+      else:
+        character = item.key[depth]
+        if character in buckets:
+          buckets[character].append(item)
+        else:
+          buckets[character] = [item]
+
+    items[lo:lo + len(ended)] = ended
+    start:int = lo + len(ended)
+    for character in sorted(buckets):
+      bucket:list = buckets[character]
+      items[start:start + len(bucket)] = bucket
+      if len(bucket) > 1:
+        stack.append((start, start + len(bucket), depth + 1))
+      start += len(bucket)
+
+  _write_back(array, [item.value for item in items])
+
+def _radix_sort_numpy(array:list, bits:int) -> bool:
+  # Vectorised LSD radix sort; returns False (leaving the array untouched) if the values aren't all integers that fit in 64 bits.
+  keys = numpy.asarray(array)
+  if keys.dtype.kind not in "iu":
+    return False
+
+  # Offsets from the minimum are computed modulo 2^64, which is exact since the range of 64-bit integers fits in 64 bits.
+  offsets = keys.astype(numpy.int64).view(numpy.uint64) - numpy.uint64(int(keys.min()) & 0xFFFFFFFFFFFFFFFF)
+  span:int = int(offsets.max())
+  digit_type = numpy.uint16 if bits > 8 else numpy.uint8
+  bits = 16 if bits > 8 else 8
+
+  # The positions of the values are sorted along with their offsets, so the original values (e.g. bools) are written back, rather than NumPy's copies of them.
+  order = numpy.arange(len(keys))
+  shift:int = 0
+  while (shift < 64) and (span >> shift) > 0:
+    digits = ((offsets >> numpy.uint64(shift)) & numpy.uint64((1 << bits) - 1)).astype(digit_type)
+    counts = numpy.bincount(digits, minlength=1 << bits)
+    if counts.max() < len(keys):
+      step = numpy.argsort(digits, kind="stable")
+      order = order[step]
+      offsets = offsets[step]
+    shift += bits
+
+  _write_back(array, [array[i] for i in order.tolist()])
+  return True
+
+def _same_bucket(buckets:list, n:int) -> bool:
+  # Whether every value landed in the same bucket, in which case the pass didn't change the order.
+  for bucket in buckets:
+    if bucket:
+      return len(bucket) == n
+  return True
+
+def _write_back(array:list, values:list) -> None:
+  if isinstance(array, list):
+    array[:] = values
+    return
+  for i in range(len(values)):
+    array[i] = values[i]
+
+if __name__ == "__main__":
+
+  array = [3, 0, 2, 3, 1, 0]
+  print(array)
+  counting_sort(array)
+  print(array)
+
+  array = [0x1234, 0x0a01, 0x12ff, 0x0a34, -5]
+  print(array)
+  radix_sort(array)
+  print(array)
+
+  array = ["pear", "fig", "apple", "kiwi", "app", "figs"]
+  print(array)
+  msd_radix_sort(array)
+  print(array)
+
+  if numpy is not None:
+    # Checks the NumPy version against the pure Python one, on an array large enough to use it.
+    import random
+    array = [random.randrange(-1 << 63, 1 << 63) for _ in range(NUMPY_THRESHOLD)] + [-1 << 63, (1 << 63) - 1, 0]
+    expected:list = list(array)
+    radix_sort(expected, key=lambda value: value)
+    radix_sort(array)
+    print("NumPy radix sort matches:", array == expected == sorted(array))
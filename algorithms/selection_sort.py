@@ -139,13 +139,17 @@ The best/average/worst-case space complexity is O(1). Here's an explanation:
   - The greatest term is a constant value, and thus the space complexity is O(1).
 """
 
-def selection_sort(array:list) -> None:
+from instrumentation import Counters
+
+def selection_sort(array:list, counters:Counters=None) -> None:
   """
   An unstable sorting algorithm that works by partitioning an array in two, where the lower sorted part iteratively accumulates the minimum values (of the upper unsorted part) in their sorted positions.
 
   Input:
     - array (list)
       A list of values.
+    - counters (Counters)
+      Counts the comparisons, swaps and passes made, if given (defaults to none). See instrumentation.py.
   Output:
     - array (list)
       A list of sorted values.
@@ -164,6 +168,10 @@ def selection_sort(array:list) -> None:
     - Worst-case
       O(1)
   """
+  if counters is not None:
+    _selection_sort_counted(array, counters)
+    return
+
   for i in range(len(array)):
 
     min_value:int = i
@@ -176,6 +184,23 @@ def selection_sort(array:list) -> None:
 
     swap(array, i, min_value)
 
+def _selection_sort_counted(array:list, counters:Counters) -> None:
+  # An instrumented copy of the loop in selection_sort.
+  for i in range(len(array)):
+
+    counters.next_pass()
+    min_value:int = i
+
+    for j in range(i+1, len(array)):
+
+      counters.compare(j, min_value)
+      if array[j] < array[min_value]:
+
+        min_value = j
+
+    counters.swap(i, min_value)
+    swap(array, i, min_value)
+
 def swap(array:list, i:int, j:int) -> None:
   """
   Swaps the value at index i with the value at index j for a given array.
@@ -0,0 +1,164 @@
+"""
+Hi! This file defines sort, a single entry point for sorting an array, which supports a key function and reverse order, and chooses which of the sorting algorithms in this folder to use by looking at how sorted the array already is.
+
+  - Here's an example:
+
+    >>  array = ["pear", "fig", "apple", "kiwi"]
+
+    >>  sort(array, key=len) == "insertion_sort"
+
+    >>  array = ["fig", "pear", "kiwi", "apple"]
+
+  - A key function is called exactly once per value. Each value is decorated with its key (i.e. stored alongside it in a Keyed object, which compares by key only; see keyed.py), the decorated values are sorted, and then the values are written back into the array in their sorted order (undecorated). Calling key inside the sort instead would call it O(n log n) times.
+
+  - With reverse=True, the array is reversed, sorted, and reversed again. For a stable sort, this keeps equal values in their original order (rather than reversing them, as sorting in descending order directly would).
+
+  - Before choosing an algorithm, sort walks over the array once, counting descents (places where a value is smaller than the value before it). The array is made up of descents + 1 ascending runs, which is a cheap measure of how sorted it already is:
+
+    - No descents; the array is already sorted, and nothing is done.
+
+    - Every pair is a descent; the array is strictly descending (so no equal values change order), and is reversed in O(n) time.
+
+    - At most 16 values; insertion sort, which has the smallest overhead (in binary mode for lists, so expensive comparisons are made O(n log n) times).
+
+    - Long runs (an average run length of at least 32 values), or stable=True; merge sort, which merges existing runs in close to O(n) time, and is stable.
+
+    - Otherwise; quick sort (introsort), which is the fastest on unordered arrays, but unstable.
+
+  - sort returns the name of the algorithm it chose (e.g. "merge_sort"), so that the choice can be checked.
+
+The best-case time complexity is O(n):
+
+  - If the array is already sorted (or strictly descending), the presortedness pass finds it in n - 1 comparisons.
+
+The average/worst-case time complexity is O(n log n):
+
+  - Every algorithm that is chosen for more than 16 values takes O(n log n) time in the worst case.
+
+The worst-case space complexity is O(n). Here's an explanation:
+
+  - With a key function, the decorated values take O(n) space, and merge sort takes O(n) space. Without a key function, quick sort only takes O(log n) space.
+"""
+
+from typing import Callable
+from insertion_sort import insertion_sort
+from merge_sort import merge_sort, reverse as reverse_range
+from quick_sort import quick_sort, INSERTION_THRESHOLD
+from keyed import Keyed
+
+PRESORTED_RUN_LENGTH:int = 32
+
+def sort(array:list, key:Callable=None, reverse:bool=False, stable:bool=True) -> str:
+  """
+  Sorts an array in place, by key and in reverse order if given, choosing an algorithm based on how sorted the array already is.
+
+  Input:
+    - array (list)
+      A list of values.
+    - key (Callable)
+      A function applied to each value once, to find the key it is sorted by (defaults to none, i.e. the values themselves).
+    - reverse (bool)
+      Whether to sort in descending order (defaults to false).
+    - stable (bool)
+      Whether equal values must keep their original order (defaults to true). If false, an unstable (but faster) algorithm may be chosen.
+  Output:
+    - algorithm (str)
+      The name of the algorithm chosen ("already_sorted", "reverse", "insertion_sort", "merge_sort" or "quick_sort").
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n log n)
+    - Worst-case
+      O(n log n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  """
+  n:int = len(array)
+  if key is None:
+    values = array
+  else:
+    values = [Keyed(key(array[i]), array[i]) for i in range(n)]
+
+  if reverse:
+    reverse_range(values, 0, n)
+
+  algorithm:str = choose_algorithm(values, stable)
+  if algorithm == "reverse":
+    reverse_range(values, 0, n)
+  elif algorithm == "insertion_sort":
+    insertion_sort(values, binary=isinstance(values, list))
+  elif algorithm == "merge_sort":
+    merge_sort(values)
+  elif algorithm == "quick_sort":
+    quick_sort(values)
+
+  if reverse:
+    reverse_range(values, 0, n)
+
+  if key is not None:
+    for i in range(n):
+      array[i] = values[i].value
+
+  return algorithm
+
+def choose_algorithm(array:list, stable:bool=True) -> str:
+  """
+  Chooses the cheapest algorithm for sorting an array, by counting its descents (i.e. the number of ascending runs, minus one).
+
+  Input:
+    - array (list)
+      A list of values.
+    - stable (bool)
+      Whether the algorithm must be stable (defaults to true).
+  Output:
+    - algorithm (str)
+      The name of the algorithm ("already_sorted", "reverse", "insertion_sort", "merge_sort" or "quick_sort").
+  Time Complexity:
+    - Best-case
+      O(n)
+    - Average-case
+      O(n)
+    - Worst-case
+      O(n)
+  Space Complexity:
+    - Best-case
+      O(1)
+    - Average-case
+      O(1)
+    - Worst-case
+      O(1)
+  """
+  n:int = len(array)
+  descents:int = 0
+  for i in range(1, n):
+    if array[i] < array[i-1]:
+      descents += 1
+
+  if descents == 0:
+    return "already_sorted"
+  if descents == n - 1:
+    return "reverse"
+  if n <= INSERTION_THRESHOLD:
+    return "insertion_sort"
+  if stable or (n >= (descents + 1) * PRESORTED_RUN_LENGTH):
+    return "merge_sort"
+  return "quick_sort"
+
+if __name__ == "__main__":
+
+  array = ["pear", "fig", "apple", "kiwi"]
+  print(array)
+  print(sort(array, key=len))
+  print(array)
+  print(sort(array, reverse=True))
+  print(array)
+
+  array = [3, 2, 1, 9, 4, 7, 6, 5, 8, 0] * 10
+  print(sort(array, stable=False))
+  print(array)
@@ -0,0 +1,207 @@
+"""
+Hi! This file defines adapters that let coroutines (asyncio tasks) share a Queue, LinkedQueue, Stack or LinkedStack, where a task that gets from an empty container (or puts into a full one) is suspended until another task puts (or gets) a value, rather than raising or spinning the event loop.
+Here's an example:
+
+  >> queue = AsyncQueue(3)
+  >> await queue.put(1)
+  >> value = await queue.get()
+
+  - Each adapter stores its values in one of the repo's own containers; a circular Queue (see static_queue.py), a LinkedQueue, an array-based Stack, or a LinkedStack. The linked containers never fill up on their own, so they are bounded by the size passed to the adapter (or unbounded if size is None).
+
+  - A task that has to wait is parked on a future, in a getters or putters line. Every put wakes the first waiting getter, and every get wakes the first waiting putter, so a fast producer is held back (backpressure) until the consumers catch up. put_nowait and get_nowait never wait, and raise an exception instead.
+
+  - get_batch(max_items) waits for at least one value, and then takes up to max_items values without waiting again.
+
+  - Every put counts an unfinished task. A consumer calls task_done() once it has finished with a value, and join() waits until every value put so far has been finished.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any
+from static_queue import Queue
+from static_stack import Stack
+from linked_queue import LinkedQueue
+from linked_stack import LinkedStack
+from node import NodePool
+
+class AsyncContainer():
+
+  def __init__(self, container:Any, size:int=None, name:str="Queue") -> None:
+    self.container = container
+    self.size = size
+    self.name = name
+    self.getters:deque = deque()
+    self.putters:deque = deque()
+    self.unfinished_tasks:int = 0
+    self.finished = asyncio.Event()
+    self.finished.set()
+
+  def __len__(self) -> int:
+    return len(self.container)
+
+  def is_full(self) -> bool:
+    if (self.size is not None) and (len(self) >= self.size):
+      return True
+    return False
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  async def put(self, value:Any) -> None:
+    while self.is_full():
+      putter:asyncio.Future = asyncio.get_running_loop().create_future()
+      self.putters.append(putter)
+      try:
+        await putter
+      except BaseException:
+        _cancel(putter, self.putters)
+        if not self.is_full() and not putter.cancelled():
+          _wake_next(self.putters)
+        raise
+    self.put_nowait(value)
+
+  def put_nowait(self, value:Any) -> None:
+    if self.is_full():
+      raise Exception(self.name + " is full")
+    self._put(value)
+    self.unfinished_tasks += 1
+    self.finished.clear()
+    _wake_next(self.getters)
+
+  async def get(self) -> Any:
+    while self.is_empty():
+      getter:asyncio.Future = asyncio.get_running_loop().create_future()
+      self.getters.append(getter)
+      try:
+        await getter
+      except BaseException:
+        _cancel(getter, self.getters)
+        if not self.is_empty() and not getter.cancelled():
+          _wake_next(self.getters)
+        raise
+    return self.get_nowait()
+
+  def get_nowait(self) -> Any:
+    if self.is_empty():
+      raise Exception(self.name + " is empty")
+    value = self._get()
+    _wake_next(self.putters)
+    return value
+
+  async def get_batch(self, max_items:int) -> list:
+    values:list = [await self.get()]
+    while (len(values) < max_items) and not self.is_empty():
+      values.append(self.get_nowait())
+    return values
+
+  def task_done(self) -> None:
+    if self.unfinished_tasks <= 0:
+      raise ValueError("task_done() called too many times")
+    self.unfinished_tasks -= 1
+    if self.unfinished_tasks == 0:
+      self.finished.set()
+
+  async def join(self) -> None:
+    if self.unfinished_tasks > 0:
+      await self.finished.wait()
+
+  def _put(self, value:Any) -> None:
+    raise NotImplementedError
+
+  def _get(self) -> Any:
+    raise NotImplementedError
+
+  def __str__(self) -> str:
+    return str(self.container)
+
+class AsyncQueue(AsyncContainer):
+
+  def __init__(self, size:int) -> None:
+    super().__init__(Queue(size), size, "Queue")
+
+  def _put(self, value:Any) -> None:
+    self.container.append(value)
+
+  def _get(self) -> Any:
+    return self.container.pop()
+
+class AsyncLinkedQueue(AsyncContainer):
+
+  def __init__(self, size:int=None, pool:NodePool=None) -> None:
+    super().__init__(LinkedQueue(pool), size, "Queue")
+
+  def _put(self, value:Any) -> None:
+    self.container.append(value)
+
+  def _get(self) -> Any:
+    return self.container.pop()
+
+class AsyncStack(AsyncContainer):
+
+  def __init__(self, size:int) -> None:
+    super().__init__(Stack(size), size, "Stack")
+
+  def _put(self, value:Any) -> None:
+    self.container.push(value)
+
+  def _get(self) -> Any:
+    return self.container.pop()
+
+class AsyncLinkedStack(AsyncContainer):
+
+  def __init__(self, size:int=None, pool:NodePool=None) -> None:
+    super().__init__(LinkedStack(pool), size, "Stack")
+
+  def _put(self, value:Any) -> None:
+    self.container.push(value)
+
+  def _get(self) -> Any:
+    return self.container.pop()
+
+def _wake_next(waiters:deque) -> None:
+  # Wakes the first waiter that is still waiting (i.e. hasn't been cancelled or already woken).
+  while waiters:
+    waiter:asyncio.Future = waiters.popleft()
+    if not waiter.done():
+      waiter.set_result(None)
+      return
+
+def _cancel(waiter:asyncio.Future, waiters:deque) -> None:
+  waiter.cancel()
+  try:
+    waiters.remove(waiter)
+  except ValueError:
+    pass
+
+if __name__ == "__main__":
+
+  async def main() -> None:
+    queue:AsyncQueue = AsyncQueue(3)
+
+    async def produce() -> None:
+      for value in range(10):
+        await queue.put(value)
+
+    async def consume(values:list) -> None:
+      while True:
+        batch:list = await queue.get_batch(4)
+        values.extend(batch)
+        for _ in batch:
+          queue.task_done()
+
+    values:list = []
+    consumer:asyncio.Task = asyncio.create_task(consume(values))
+    await produce()
+    await queue.join()
+    consumer.cancel()
+    print(values)
+
+    stack:AsyncLinkedStack = AsyncLinkedStack(3)
+    for value in range(3):
+      stack.put_nowait(value)
+    print(stack, len(stack), stack.is_full())
+    print(await stack.get(), await stack.get_batch(5))
+
+  asyncio.run(main())
@@ -0,0 +1,298 @@
+"""
+Hi! This file defines a binary search tree, a data structure that maps keys to values while keeping the keys in sorted order, where storing, finding and deleting a key takes O(log n) time.
+Here's an example:
+
+  >> tree = BinarySearchTree()
+  >> tree[3] = "c"
+
+  - Every node has a key, a value, and up to two children, where every key in the left subtree is less than the node's key, and every key in the right subtree is greater. Finding a key starts at the root, and moves left or right depending on how the key compares with the node's key.
+
+  - If keys are inserted in sorted order (e.g. timestamps), a plain binary search tree only ever moves right, and becomes a linked list, where every operation takes O(n) time. This tree is an AVL tree; every node stores the height of its subtree, and after every insert or delete, any node whose children's heights differ by more than one is rotated back into balance. This keeps the height of the tree below 1.44 * log2(n).
+
+  - Every node also stores the number of nodes in its subtree (its size). This lets the tree find the rank of a key (how many keys are less than it) and select the k-th smallest key in O(log n) time, by adding up or comparing against the sizes of left subtrees on the way down.
+"""
+
+from typing import Any, Iterable, Iterator
+
+class TreeNode():
+
+  def __init__(self, key:Any, value:Any) -> None:
+    self.key = key
+    self.value = value
+    self.left = None
+    self.right = None
+    self.height = 1
+    self.size = 1
+
+  def __str__(self) -> str:
+    return str(self.key) + ": " + str(self.value)
+
+class BinarySearchTree():
+
+  def __init__(self) -> None:
+    self.root:TreeNode = None
+    self.modifications:int = 0
+
+  def __len__(self) -> int:
+    return _size(self.root)
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def __setitem__(self, key:Any, value:Any) -> None:
+    self.root = self._insert(self.root, key, value)
+
+  def __getitem__(self, key:Any) -> Any:
+    node:TreeNode = self._find(key)
+    if node is None:
+      raise KeyError(key)
+    return node.value
+
+  def get(self, key:Any, default:Any=None) -> Any:
+    node:TreeNode = self._find(key)
+    if node is None:
+      return default
+    return node.value
+
+  def __contains__(self, key:Any) -> bool:
+    return self._find(key) is not None
+
+  def __delitem__(self, key:Any) -> None:
+    self.root = self._delete(self.root, key)
+    self.modifications += 1
+
+  def min(self) -> Any:
+    if self.is_empty():
+      raise Exception("Tree is empty")
+    node:TreeNode = self.root
+    while node.left is not None:
+      node = node.left
+    return node.key
+
+  def max(self) -> Any:
+    if self.is_empty():
+      raise Exception("Tree is empty")
+    node:TreeNode = self.root
+    while node.right is not None:
+      node = node.right
+    return node.key
+
+  def floor(self, key:Any) -> Any:
+    node:TreeNode = self.root
+    found:TreeNode = None
+    while node is not None:
+      if key < node.key:
+        node = node.left
+      elif node.key < key:
+        found = node
+        node = node.right
+      else:
+        return node.key
+    if found is None:
+      raise KeyError(key)
+    return found.key
+
+  def ceiling(self, key:Any) -> Any:
+    node:TreeNode = self.root
+    found:TreeNode = None
+    while node is not None:
+      if key < node.key:
+        found = node
+        node = node.left
+      elif node.key < key:
+        node = node.right
+      else:
+        return node.key
+    if found is None:
+      raise KeyError(key)
+    return found.key
+
+  def rank(self, key:Any) -> int:
+    node:TreeNode = self.root
+    rank:int = 0
+    while node is not None:
+      if key < node.key:
+        node = node.left
+      elif node.key < key:
+        rank += _size(node.left) + 1
+        node = node.right
+      else:
+        return rank + _size(node.left)
+    return rank
+
+  def select(self, i:int) -> Any:
+    if (i < 0) or (i >= len(self)):
+      raise IndexError
+    node:TreeNode = self.root
+    while True:
+      left:int = _size(node.left)
+      if i < left:
+        node = node.left
+      elif i > left:
+        i -= left + 1
+        node = node.right
+      else:
+        return node.key
+
+  def range(self, lo:Any=None, hi:Any=None) -> Iterator:
+    # Lazily yields (key, value) pairs with lo <= key < hi in order, keeping only the path to the next node on a stack (which an insert or delete would invalidate).
+    modifications:int = self.modifications
+    stack:list = []
+    node:TreeNode = self.root
+    while stack or (node is not None):
+      if node is not None:
+        if (lo is not None) and (node.key < lo):
+          node = node.right
+        else:
+          stack.append(node)
+          node = node.left
+      else:
+        node = stack.pop()
+        if (hi is not None) and not (node.key < hi):
+          return
+        yield node.key, node.value
+        if self.modifications != modifications:
+          raise RuntimeError("Container changed during iteration")
+        node = node.right
+
+  def __iter__(self) -> Iterator:
+    for key, _ in self.range():
+      yield key
+
+  def items(self) -> Iterator:
+    return self.range()
+
+  @staticmethod
+  def from_sorted(items:Iterable) -> "BinarySearchTree":
+    items = list(items)
+    for i in range(1, len(items)):
+      if not (items[i-1][0] < items[i][0]):
+        raise ValueError
+    tree:BinarySearchTree = BinarySearchTree()
+    tree.root = _build(items, 0, len(items))
+    return tree
+
+  def _find(self, key:Any) -> TreeNode:
+    node:TreeNode = self.root
+    while node is not None:
+      if key < node.key:
+        node = node.left
+      elif node.key < key:
+        node = node.right
+      else:
+        return node
+    return None
+
+  def _insert(self, node:TreeNode, key:Any, value:Any) -> TreeNode:
+    if node is None:
+      self.modifications += 1
+      return TreeNode(key, value)
+    if key < node.key:
+      node.left = self._insert(node.left, key, value)
+    elif node.key < key:
+      node.right = self._insert(node.right, key, value)
+    else:
+      node.value = value
+      return node
+    return _rebalance(node)
+
+  def _delete(self, node:TreeNode, key:Any) -> TreeNode:
+    if node is None:
+      raise KeyError(key)
+    if key < node.key:
+      node.left = self._delete(node.left, key)
+    elif node.key < key:
+      node.right = self._delete(node.right, key)
+    else:
+      if node.left is None:
+        return node.right
+      if node.right is None:
+        return node.left
+      successor:TreeNode = node.right
+      while successor.left is not None:
+        successor = successor.left
+      node.key = successor.key
+      node.value = successor.value
+      node.right = self._delete(node.right, successor.key)
+    return _rebalance(node)
+
+  def __str__(self) -> str:
+    return "{" + ", ".join(repr(key) + ": " + repr(value) for key, value in self.items()) + "}"
+
+def _size(node:TreeNode) -> int:
+  if node is None:
+    return 0
+  return node.size
+
+def _height(node:TreeNode) -> int:
+  if node is None:
+    return 0
+  return node.height
+
+def _update(node:TreeNode) -> None:
+  node.height = max(_height(node.left), _height(node.right)) + 1
+  node.size = _size(node.left) + _size(node.right) + 1
+
+def _rotate_left(node:TreeNode) -> TreeNode:
+  right:TreeNode = node.right
+  node.right = right.left
+  right.left = node
+  _update(node)
+  _update(right)
+  return right
+
+def _rotate_right(node:TreeNode) -> TreeNode:
+  left:TreeNode = node.left
+  node.left = left.right
+  left.right = node
+  _update(node)
+  _update(left)
+  return left
+
+def _rebalance(node:TreeNode) -> TreeNode:
+  _update(node)
+  balance:int = _height(node.left) - _height(node.right)
+  if balance > 1:
+    if _height(node.left.left) < _height(node.left.right):
+      node.left = _rotate_left(node.left)
+    return _rotate_right(node)
+  if balance < -1:
+    if _height(node.right.right) < _height(node.right.left):
+      node.right = _rotate_right(node.right)
+    return _rotate_left(node)
+  return node
+
+def _build(items:list, lo:int, hi:int) -> TreeNode:
+  # Builds a perfectly balanced subtree from the sorted items[lo:hi], rooted at the middle item.
+  if lo >= hi:
+    return None
+  mid:int = (lo + hi) // 2
+  node:TreeNode = TreeNode(items[mid][0], items[mid][1])
+  node.left = _build(items, lo, mid)
+  node.right = _build(items, mid + 1, hi)
+  _update(node)
+  return node
+
+if __name__ == "__main__":
+
+  tree:BinarySearchTree = BinarySearchTree()
+
+  print(tree, len(tree))
+  tree[1] = "a"
+  tree[3] = "c"
+  tree[2] = "b"
+  tree[5] = "e"
+  print(tree, len(tree))
+
+  print(tree[1], tree[3], tree[2])
+  print(tree.min(), tree.max(), tree.floor(4), tree.ceiling(4))
+  print(tree.rank(3), tree.select(3))
+  print(list(tree.range(2, 5)))
+
+  del tree[3]
+  print(tree, len(tree))
+
+  tree = BinarySearchTree.from_sorted([(i, str(i)) for i in range(7)])
+  print(tree, len(tree), tree.root.key, tree.root.height)
@@ -0,0 +1,259 @@
+"""
+Hi! This file defines queues that can be shared between threads, where a thread that gets from an empty queue (or puts into a full one) sleeps until another thread puts (or gets) a value, rather than polling.
+Here's an example:
+
+  >> queue = BlockingQueue(3)
+
+  - A BlockingQueue wraps a bounded Queue (see static_queue.py) with a lock, and two condition variables; not_empty (which getters wait on) and not_full (which putters wait on). Every put wakes one getter, and every get wakes one putter. get_batch(max_items) waits for at least one value, and then takes up to max_items values with a single pop_many.
+
+  - close() stops any more values from being put. Values already in the queue can still be got, and once the queue is both closed and empty, getters are woken and raise QueueClosed instead of waiting forever, which marks the end of the stream. A getter that times out instead raises an exception (or, for get_batch, returns an empty list), so the two can't be mistaken for each other. drain() takes every value left in the queue at once.
+
+  - An SPSCQueue (single-producer, single-consumer) avoids the lock altogether when it is neither full nor empty. The producer only ever writes tail (the number of values ever put) and the consumer only ever writes head (the number of values ever got), so neither overwrites the other's index, and a value is always written into its slot before tail is advanced past it. This relies on single reads and writes of attributes and list slots being atomic, as they are in CPython. A lock is only taken when a thread has to sleep, or has to wake the other one up.
+
+  - Only one thread may put into an SPSCQueue, and only one thread may get from it; use a BlockingQueue otherwise.
+"""
+
+import threading
+from time import monotonic
+from typing import Any
+from static_queue import Queue
+
+class QueueClosed(Exception):
+  # Raised by put once a queue is closed, and by get and get_batch once it is also empty.
+  pass
+
+class BlockingQueue():
+
+  def __init__(self, size:int) -> None:
+    self.queue:Queue = Queue(size)
+    self.lock = threading.Lock()
+    self.not_empty = threading.Condition(self.lock)
+    self.not_full = threading.Condition(self.lock)
+    self.closed:bool = False
+
+  def __len__(self) -> int:
+    with self.lock:
+      return len(self.queue)
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def is_closed(self) -> bool:
+    return self.closed
+
+  def put(self, value:Any, timeout:float=None) -> None:
+    with self.not_full:
+      if self.closed:
+        raise QueueClosed("Queue is closed")
+      if not _wait(self.not_full, lambda: self.closed or not self.queue.is_full(), timeout):
+        raise Exception("Queue is full")
+      if self.closed:
+        raise QueueClosed("Queue is closed")
+      self.queue.append(value)
+      self.not_empty.notify()
+
+  def get(self, timeout:float=None) -> Any:
+    with self.not_empty:
+      if not _wait(self.not_empty, lambda: self.closed or not self.queue.is_empty(), timeout):
+        raise Exception("Queue is empty")
+      if self.queue.is_empty():
+        raise QueueClosed("Queue is closed")
+      value = self.queue.pop()
+      self.not_full.notify()
+      return value
+
+  def get_batch(self, max_items:int, timeout:float=None) -> list:
+    # Returns between 1 and max_items values, or an empty list if none arrive before the timeout.
+    if max_items < 1:
+      raise ValueError
+    with self.not_empty:
+      if not _wait(self.not_empty, lambda: self.closed or not self.queue.is_empty(), timeout):
+        return []
+      if self.queue.is_empty():
+        raise QueueClosed("Queue is closed")
+      values:list = self.queue.pop_many(max_items)
+      self.not_full.notify(len(values))
+      return values
+
+  def close(self) -> None:
+    with self.lock:
+      self.closed = True
+      self.not_empty.notify_all()
+      self.not_full.notify_all()
+
+  def drain(self) -> list:
+    with self.lock:
+      values:list = self.queue.pop_many(len(self.queue))
+      self.not_full.notify_all()
+      return values
+
+  def __str__(self) -> str:
+    with self.lock:
+      return str(self.queue)
+
+class SPSCQueue():
+
+  def __init__(self, size:int) -> None:
+    capacity:int = 1
+    while capacity < size:
+      capacity *= 2
+    self.array:list = [None for _ in range(capacity)]
+    self.mask:int = capacity - 1
+    self.size:int = size
+    self.head:int = 0
+    self.tail:int = 0
+    self.closed:bool = False
+    self.lock = threading.Lock()
+    self.changed = threading.Condition(self.lock)
+    self.consumer_waiting:bool = False
+    self.producer_waiting:bool = False
+
+  def __len__(self) -> int:
+    return self.tail - self.head
+
+  def is_full(self) -> bool:
+    if len(self) >= self.size:
+      return True
+    return False
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def put_nowait(self, value:Any) -> None:
+    if self.closed:
+      raise QueueClosed("Queue is closed")
+    tail:int = self.tail
+    if tail - self.head >= self.size:
+      raise Exception("Queue is full")
+    self.array[tail & self.mask] = value
+    self.tail = tail + 1
+    if self.consumer_waiting:
+      with self.changed:
+        self.changed.notify_all()
+
+  def get_nowait(self) -> Any:
+    head:int = self.head
+    if head == self.tail:
+      if self.closed:
+        raise QueueClosed("Queue is closed")
+      raise Exception("Queue is empty")
+    value = self.array[head & self.mask]
+    self.array[head & self.mask] = None
+    self.head = head + 1
+    if self.producer_waiting:
+      with self.changed:
+        self.changed.notify_all()
+    return value
+
+  def put(self, value:Any, timeout:float=None) -> None:
+    if self.closed:
+      raise QueueClosed("Queue is closed")
+    if self.is_full():
+      with self.changed:
+        self.producer_waiting = True
+        ready:bool = _wait(self.changed, lambda: self.closed or not self.is_full(), timeout)
+        self.producer_waiting = False
+      if not ready:
+        raise Exception("Queue is full")
+    self.put_nowait(value)
+
+  def get(self, timeout:float=None) -> Any:
+    if not self._wait_for_value(timeout):
+      raise Exception("Queue is empty")
+    return self.get_nowait()
+
+  def get_batch(self, max_items:int, timeout:float=None) -> list:
+    # Returns between 1 and max_items values, or an empty list if none arrive before the timeout.
+    if max_items < 1:
+      raise ValueError
+    if not self._wait_for_value(timeout):
+      return []
+    values:list = [self.get_nowait()]
+    while (len(values) < max_items) and not self.is_empty():
+      values.append(self.get_nowait())
+    return values
+
+  def _wait_for_value(self, timeout:float) -> bool:
+    # Waits until a value can be got (or the queue is closed); returns False if the timeout passed first.
+    if not self.is_empty():
+      return True
+    with self.changed:
+      self.consumer_waiting = True
+      ready:bool = _wait(self.changed, lambda: self.closed or not self.is_empty(), timeout)
+      self.consumer_waiting = False
+    return ready
+
+  def close(self) -> None:
+    self.closed = True
+    with self.changed:
+      self.changed.notify_all()
+
+  def __str__(self) -> str:
+    return str([self.array[i & self.mask] for i in range(self.head, self.tail)])
+
+def _wait(condition:threading.Condition, predicate:Any, timeout:float=None) -> bool:
+  # Waits on condition (whose lock must be held) until predicate() is true, or until timeout seconds have passed; returns predicate().
+  if timeout is None:
+    while not predicate():
+      condition.wait()
+    return True
+  deadline:float = monotonic() + timeout
+  while not predicate():
+    remaining:float = deadline - monotonic()
+    if remaining <= 0:
+      return False
+    condition.wait(remaining)
+  return True
+
+if __name__ == "__main__":
+
+  queue:BlockingQueue = BlockingQueue(3)
+
+  def produce() -> None:
+    for value in range(10):
+      queue.put(value)
+    queue.close()
+
+  producer = threading.Thread(target=produce)
+  producer.start()
+  values:list = []
+  try:
+    while True:
+      values.extend(queue.get_batch(4, timeout=1))
+  except QueueClosed:
+    pass
+  producer.join()
+  print(values)
+
+  spsc_queue:SPSCQueue = SPSCQueue(3)
+
+  def produce_spsc() -> None:
+    for value in range(10):
+      spsc_queue.put(value)
+    spsc_queue.close()
+
+  producer = threading.Thread(target=produce_spsc)
+  producer.start()
+  values = []
+  try:
+    while True:
+      values.extend(spsc_queue.get_batch(4, timeout=1))
+  except QueueClosed:
+    pass
+  producer.join()
+  print(values)
+
+  # get_batch needs room for at least one value, so that [] only ever means a timeout.
+  for batch_queue in (BlockingQueue(3), SPSCQueue(3)):
+    batch_queue.put(1)
+    for max_items in (0, -1):
+      try:
+        batch_queue.get_batch(max_items)
+        raise AssertionError("get_batch accepted max_items < 1")
+      except ValueError:
+        pass
+    print(len(batch_queue), batch_queue.get_batch(4))
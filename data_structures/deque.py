@@ -0,0 +1,185 @@
+"""
+Hi! This file defines a deque (double-ended queue), a data structure that stores values in order, where appending or popping a value at either end takes O(1) time.
+Here's an example:
+
+  >> deque = Deque()
+
+  - Values are stored in a circular array, like a Queue (see static_queue.py), between the front index (the first value) and the back index (one past the last value). append and pop move the back index, and appendleft and popleft move the front index, and both wrap around the ends of the array. The array's capacity is always a power of two, so wrapping is a bit-mask.
+
+  - When the array is full, its values are copied, in order, into an array twice the size (with the front at index 0), so appends take O(1) amortised time.
+
+  - With a maxlen, the deque never holds more than maxlen values; appending to a full deque overwrites the value at the other end (e.g. a sliding window over the last maxlen values), and the array never grows.
+
+  - Indexing (deque[i]) is O(1); value i is stored at array[(front + i) & mask]. Negative indices count back from the end, so deque[-1] is the last value.
+
+  - rotate(k) moves the last k values to the front (or the first -k values to the back, if k is negative). It moves whichever is fewer, k or len(deque) - k values, and if the array is exactly full, it only moves the front and back indices.
+"""
+
+from typing import Any, Iterable, Iterator
+from iterator import ArrayIterator
+
+class Deque():
+
+  def __init__(self, size:int=8, maxlen:int=None) -> None:
+    if maxlen is not None:
+      if maxlen < 1:
+        raise ValueError
+      size = maxlen
+    capacity:int = 1
+    while capacity < size:
+      capacity *= 2
+    self.array = [None for _ in range(capacity)]
+    self.mask = capacity - 1
+    self.front = 0
+    self.back = 0
+    self.length = 0
+    self.maxlen = maxlen
+    self.modifications = 0
+
+  def __len__(self) -> int:
+    return self.length
+
+  def is_full(self) -> bool:
+    if (self.maxlen is not None) and (len(self) == self.maxlen):
+      return True
+    return False
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def __getitem__(self, i:int) -> Any:
+    return self.array[self._slot(i)]
+
+  def __setitem__(self, i:int, value:Any) -> None:
+    self.array[self._slot(i)] = value
+
+  def append(self, value:Any) -> None:
+    if self.is_full():
+      self.popleft()
+    elif len(self) == len(self.array):
+      self._resize(len(self) + 1)
+    self.array[self.back] = value
+    self.back = (self.back + 1) & self.mask
+    self.length += 1
+    self.modifications += 1
+
+  def appendleft(self, value:Any) -> None:
+    if self.is_full():
+      self.pop()
+    elif len(self) == len(self.array):
+      self._resize(len(self) + 1)
+    self.front = (self.front - 1) & self.mask
+    self.array[self.front] = value
+    self.length += 1
+    self.modifications += 1
+
+  def extend(self, values:Iterable) -> None:
+    for value in values:
+      self.append(value)
+
+  def peek(self) -> Any:
+    if self.is_empty():
+      raise Exception("Deque is empty")
+    return self.array[(self.back - 1) & self.mask]
+
+  def peekleft(self) -> Any:
+    if self.is_empty():
+      raise Exception("Deque is empty")
+    return self.array[self.front]
+
+  def pop(self) -> Any:
+    if self.is_empty():
+      raise Exception("Deque is empty")
+    self.back = (self.back - 1) & self.mask
+    value = self.array[self.back]
+    self.array[self.back] = None
+    self.length -= 1
+    self.modifications += 1
+    return value
+
+  def popleft(self) -> Any:
+    if self.is_empty():
+      raise Exception("Deque is empty")
+    value = self.array[self.front]
+    self.array[self.front] = None
+    self.front = (self.front + 1) & self.mask
+    self.length -= 1
+    self.modifications += 1
+    return value
+
+  def rotate(self, k:int=1) -> None:
+    n:int = len(self)
+    if n <= 1:
+      return
+    k %= n
+    if k == 0:
+      return
+    array:list = self.array
+    mask:int = self.mask
+    if n == len(array):
+      self.front = (self.front - k) & mask
+      self.back = self.front
+    elif k <= n // 2:
+      for _ in range(k):
+        self.back = (self.back - 1) & mask
+        self.front = (self.front - 1) & mask
+        array[self.front] = array[self.back]
+        array[self.back] = None
+    else:
+      for _ in range(n - k):
+        array[self.back] = array[self.front]
+        array[self.front] = None
+        self.front = (self.front + 1) & mask
+        self.back = (self.back + 1) & mask
+    self.modifications += 1
+
+  def _slot(self, i:int) -> int:
+    if i < 0:
+      i += len(self)
+    if (i < 0) or (i >= len(self)):
+      raise IndexError
+    return (self.front + i) & self.mask
+
+  def _resize(self, size:int) -> None:
+    capacity:int = len(self.array)
+    while capacity < size:
+      capacity *= 2
+    first:int = min(len(self), len(self.array) - self.front)
+    values:list = self.array[self.front:self.front + first] + self.array[:len(self) - first]
+    self.array = values + [None] * (capacity - len(values))
+    self.mask = capacity - 1
+    self.front = 0
+    self.back = len(values) & self.mask
+
+  def __iter__(self) -> Iterator:
+    return ArrayIterator(self, self.array, self.front)
+
+  def __reversed__(self) -> Iterator:
+    return ArrayIterator(self, self.array, (self.back - 1) & self.mask, -1)
+
+  def __str__(self) -> str:
+    return str(list(self))
+
+if __name__ == "__main__":
+
+  deque:Deque = Deque(2)
+  print(deque, len(deque))
+  deque.append(1)
+  deque.append(3)
+  deque.appendleft(2)
+  print(deque, len(deque), len(deque.array))
+  print(deque[0], deque[-1], deque.peekleft(), deque.peek())
+  deque.rotate(1)
+  print(deque, len(deque))
+  deque.rotate(-2)
+  print(deque, len(deque))
+  print(deque.pop(), deque.popleft())
+  print(deque, len(deque))
+
+  window:Deque = Deque(maxlen=3)
+  window.extend([1, 3, 2, 5, 4])
+  print(window, len(window))
+  window.appendleft(6)
+  print(window, len(window))
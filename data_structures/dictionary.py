@@ -0,0 +1,204 @@
+"""
+Hi! This file defines a dictionary (a hash map), a data structure that maps keys to values, where storing, finding and deleting a key takes O(1) expected time.
+Here's an example:
+
+  >> dictionary = Dictionary()
+  >> dictionary["a"] = 1
+
+  - The dictionary is split into two arrays, like a Python dict. The entries are stored densely (in insertion order) across three fixed-size Python lists, of hashes, keys and values, which are never appended to, but replaced with larger lists when full. The index is a smaller, sparse array of slots, where each slot holds either -1 (empty) or the position of an entry. Since the index only holds small integers, it is stored as a typed array of 1, 2, 4 or 8 byte integers (whichever is large enough), rather than as pointers.
+
+  - A key's home slot is hash(key) masked to the size of the index (always a power of two). If the home slot is taken, the following slots are probed in turn (open addressing). Probing uses Robin Hood hashing; when a key being inserted has probed further from its home slot than the key already in a slot, they swap places, and the displaced key carries on probing. This keeps probe lengths short and even, and lets a search stop as soon as it reaches a key that is closer to its own home slot than the searched key would be.
+
+  - Deleting a key does not leave a "deleted" marker (tombstone) in the index. Instead, the keys after it are shifted back by one slot, until an empty slot or a key already in its home slot is reached (backward shift deletion). The deleted entry is left as a hole in the entries lists, and holes are removed the next time the lists are resized.
+
+  - When the entries lists are full, they are compacted, and the index is resized so that no more than load_factor of its slots are in use.
+"""
+
+from array import array
+from typing import Any, Iterator
+from iterator import EntryIterator
+
+class Dictionary():
+
+  def __init__(self, size:int=8, load_factor:float=2/3) -> None:
+    if not (0 < load_factor < 1):
+      raise ValueError
+    self.load_factor:float = load_factor
+    self.length:int = 0
+    self.modifications:int = 0
+    self._allocate(size)
+
+  def __len__(self) -> int:
+    return self.length
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def __setitem__(self, key:Any, value:Any) -> None:
+    h:int = hash(key)
+    slot:int = self._lookup(key, h)
+    if slot >= 0:
+      self.entry_values[self.indices[slot]] = value
+      return
+    if self.used == self.size:
+      self._resize()
+    entry:int = self.used
+    self.entry_hashes[entry] = h
+    self.entry_keys[entry] = key
+    self.entry_values[entry] = value
+    self.used += 1
+    self.length += 1
+    self.modifications += 1
+    self._insert_index(entry, h)
+
+  def __getitem__(self, key:Any) -> Any:
+    slot:int = self._lookup(key, hash(key))
+    if slot < 0:
+      raise KeyError(key)
+    return self.entry_values[self.indices[slot]]
+
+  def get(self, key:Any, default:Any=None) -> Any:
+    slot:int = self._lookup(key, hash(key))
+    if slot < 0:
+      return default
+    return self.entry_values[self.indices[slot]]
+
+  def __contains__(self, key:Any) -> bool:
+    return self._lookup(key, hash(key)) >= 0
+
+  def __delitem__(self, key:Any) -> None:
+    slot:int = self._lookup(key, hash(key))
+    if slot < 0:
+      raise KeyError(key)
+
+    entry:int = self.indices[slot]
+    self.entry_hashes[entry] = None
+    self.entry_keys[entry] = None
+    self.entry_values[entry] = None
+    self.length -= 1
+    self.modifications += 1
+
+    indices:array = self.indices
+    hashes:list = self.entry_hashes
+    mask:int = self.mask
+    following:int = (slot + 1) & mask
+    while indices[following] != -1:
+      if ((following - hashes[indices[following]]) & mask) == 0:
+        break
+      indices[slot] = indices[following]
+      slot = following
+      following = (following + 1) & mask
+    indices[slot] = -1
+
+  def __iter__(self) -> Iterator:
+    return EntryIterator(self, self.entry_hashes, self.entry_keys)
+
+  def items(self) -> Iterator:
+    return EntryIterator(self, self.entry_hashes, self.entry_keys, self.entry_values)
+
+  def _lookup(self, key:Any, h:int) -> int:
+    indices:array = self.indices
+    hashes:list = self.entry_hashes
+    mask:int = self.mask
+    slot:int = h & mask
+    distance:int = 0
+    while True:
+      entry:int = indices[slot]
+      if entry == -1:
+        return -1
+      # Robin Hood invariant: the searched key would have displaced any key closer to its home slot.
+      if ((slot - hashes[entry]) & mask) < distance:
+        return -1
+      if (hashes[entry] == h) and ((self.entry_keys[entry] is key) or (self.entry_keys[entry] == key)):
+        return slot
+      slot = (slot + 1) & mask
+      distance += 1
+
+  def _insert_index(self, entry:int, h:int) -> None:
+    indices:array = self.indices
+    hashes:list = self.entry_hashes
+    mask:int = self.mask
+    slot:int = h & mask
+    distance:int = 0
+    while True:
+      other:int = indices[slot]
+      if other == -1:
+        indices[slot] = entry
+        return
+      other_distance:int = (slot - hashes[other]) & mask
+      if other_distance < distance:
+        indices[slot] = entry
+        entry = other
+        distance = other_distance
+      slot = (slot + 1) & mask
+      distance += 1
+
+  def _allocate(self, size:int) -> None:
+    capacity:int = 8
+    while capacity * self.load_factor < size:
+      capacity *= 2
+    self.mask:int = capacity - 1
+    self.size:int = max(1, int(capacity * self.load_factor))
+    self.used:int = 0
+
+    if capacity <= 2**7:
+      typecode:str = "b"
+    elif capacity <= 2**15:
+      typecode = "h"
+    elif capacity <= 2**31:
+      typecode = "i"
+    else:
+      typecode = "q"
+    self.indices:array = array(typecode, [-1]) * capacity
+
+    self.entry_hashes:list = [None for _ in range(self.size)]
+    self.entry_keys:list = [None for _ in range(self.size)]
+    self.entry_values:list = [None for _ in range(self.size)]
+
+  def _resize(self) -> None:
+    hashes:list = self.entry_hashes
+    keys:list = self.entry_keys
+    values:list = self.entry_values
+    used:int = self.used
+
+    self._allocate(max(2 * self.length, 8))
+    self.modifications += 1
+
+    for entry in range(used):
+      if hashes[entry] is not None:
+        self.entry_hashes[self.used] = hashes[entry]
+        self.entry_keys[self.used] = keys[entry]
+        self.entry_values[self.used] = values[entry]
+        self._insert_index(self.used, hashes[entry])
+        self.used += 1
+
+  def __str__(self) -> str:
+    return "{" + ", ".join(repr(key) + ": " + repr(value) for key, value in self.items()) + "}"
+
+if __name__ == "__main__":
+
+  dictionary:Dictionary = Dictionary()
+
+  print(dictionary, len(dictionary))
+  dictionary["a"] = 1
+  dictionary["c"] = 3
+  dictionary["b"] = 2
+  print(dictionary, len(dictionary))
+
+  print(dictionary["a"], dictionary["c"], dictionary["b"])
+  dictionary["a"] = 4
+  dictionary["c"] = 6
+  dictionary["b"] = 5
+
+  print(dictionary, len(dictionary))
+  del dictionary["c"]
+  print(dictionary, len(dictionary), "c" in dictionary)
+
+  dictionary["d"] = 7
+  print(dictionary, len(dictionary))
+
+  # The entries are stored under entry_ names, so a keys or values method can't be shadowed by them.
+  assert not hasattr(dictionary, "keys") and not hasattr(dictionary, "values")
+  print(list(dictionary), list(dictionary.items()))
@@ -3,16 +3,29 @@ Hi! This file defines a dynamic array, a data structure that supports random-acc
 Here's an example:
 
   >> array = DynamicArray(3)
+
+  - Values are stored in a static array. When it is full, the values are copied into a new static array resize_factor times larger, so that appending n values only copies O(n) values in total. reserve(n), extend(values) and slice assignment (e.g. array[2:5] = values) resize at most once, however many values are added.
+
+  - When deletes leave fewer than shrink_threshold of the static array's slots in use, the values are copied into a smaller static array, resize_factor times larger than the number of values. Since shrink_threshold must be less than 1 / resize_factor, a newly shrunk array is neither full nor below the threshold, so alternating appends and deletes never resize back and forth.
+
+  - A typecode (see static_array.py) is kept across resizes. Note that memoryview() returns a view of the current static array; after a resize, the view still refers to the old values.
 """
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 from static_array import StaticArray
+from iterator import ArrayIterator
 
 class DynamicArray():
 
-  def __init__(self) -> None:
-    self.array:StaticArray = StaticArray(1)
-    self.resize_factor:int = 2
+  def __init__(self, size:int=1, resize_factor:float=2, shrink_threshold:float=0.25, typecode:str=None) -> None:
+    if (resize_factor <= 1) or not (0 <= shrink_threshold < 1 / resize_factor):
+      raise ValueError
+    self.array:StaticArray = StaticArray(max(size, 1), typecode)
+    self.typecode:str = typecode
+    self.minimum_size:int = max(size, 1)
+    self.resize_factor:float = resize_factor
+    self.shrink_threshold:float = shrink_threshold
+    self.modifications:int = 0
 
   def __len__(self) -> int:
     return len(self.array)
@@ -23,6 +36,19 @@ class DynamicArray():
     return False
   
   def __setitem__(self, i:int, value:Any) -> None:
+    if isinstance(i, slice) and (i.step in (None, 1)):
+      # Assigning to a slice can change the length, so the static array is grown to fit first (or shrunk afterwards).
+      start, stop, _ = i.indices(len(self))
+      value = list(value)
+      length:int = len(self)
+      new_length:int = length - (max(start, stop) - start) + len(value)
+      if new_length > self.array.size:
+        self._grow(new_length)
+      self.array[i] = value
+      if new_length != length:
+        self.modifications += 1
+        self._shrink()
+      return
     self.array[i] = value
 
   def __getitem__(self, i:int) -> Any:
@@ -30,21 +56,61 @@ class DynamicArray():
   
   def append(self, value:Any) -> None:
     if self.array.is_full():
-      self._resize()
+      self._grow(len(self) + 1)
     self.array.append(value)
+    self.modifications += 1
+
+  def insert(self, i:int, value:Any) -> None:
+    if (i < 0) or (i > len(self)):
+      raise IndexError
+    if self.array.is_full():
+      self._grow(len(self) + 1)
+    self.array.insert(i, value)
+    self.modifications += 1
+
+  def extend(self, values:Iterable) -> None:
+    values = list(values)
+    length:int = len(self)
+    if length + len(values) > self.array.size:
+      self._grow(length + len(values))
+    self.array.insert_many(length, values)
+    self.modifications += 1
+
+  def reserve(self, size:int) -> None:
+    if size > self.array.size:
+      self._resize(size)
 
   def find(self, value:Any) -> int:
     return self.array.find(value)
     
   def __delitem__(self, i:int) -> None:
     del self.array[i]
+    self.modifications += 1
+    self._shrink()
+
+  def _grow(self, size:int) -> None:
+    self._resize(max(size, int(self.array.size * self.resize_factor)))
 
-  def _resize(self) -> None:
-    resized_array:StaticArray = StaticArray(len(self) * self.resize_factor)
-    for value in self.array:
-      resized_array.append(value)
+  def _shrink(self) -> None:
+    if (len(self) < self.array.size * self.shrink_threshold) and (self.array.size > self.minimum_size):
+      self._resize(max(int(len(self) * self.resize_factor), self.minimum_size))
+
+  def _resize(self, size:int) -> None:
+    length:int = len(self)
+    resized_array:StaticArray = StaticArray(size, self.typecode)
+    resized_array.array[:length] = self.array.array[:length]
+    resized_array.length = length
     self.array = resized_array
   
+  def memoryview(self) -> memoryview:
+    return self.array.memoryview()
+
+  def __iter__(self) -> Iterator:
+    return ArrayIterator(self, self.array.array, 0)
+
+  def __reversed__(self) -> Iterator:
+    return ArrayIterator(self, self.array.array, len(self) - 1, -1)
+
   def __str__(self) -> str:
     return str(self.array)
   
@@ -69,4 +135,24 @@ if __name__ == "__main__":
   print(dynamic_array, len(dynamic_array))
 
   dynamic_array.append(7)
-  print(dynamic_array, len(dynamic_array))
\ No newline at end of file
+  print(dynamic_array, len(dynamic_array))
+
+  dynamic_array.insert(0, 3)
+  dynamic_array.insert(len(dynamic_array), 8)
+  print(dynamic_array, len(dynamic_array), dynamic_array.array.size)
+
+  dynamic_array.extend(range(8, 16))
+  print(dynamic_array, len(dynamic_array), dynamic_array.array.size)
+  for _ in range(9):
+    del dynamic_array[0]
+  print(dynamic_array, len(dynamic_array), dynamic_array.array.size)
+
+  # Inserting grows the array like appending does.
+  dynamic_array = DynamicArray(2, typecode="q")
+  values:list = []
+  for value in [5, 1, 4, 2, 3, 0]:
+    i:int = sum(1 for stored in values if stored <= value)
+    dynamic_array.insert(i, value)
+    values.insert(i, value)
+  assert list(dynamic_array) == values == sorted(values)
+  print("Inserts match lists", dynamic_array.array.size)
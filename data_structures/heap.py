@@ -0,0 +1,151 @@
+"""
+Hi! This file defines a heap, a data structure that supports finding and removing the minimum stored value in O(log n) time, and adding values in O(log n) time.
+Here's an example:
+
+  >> heap = Heap(7)
+
+  - Values are stored in a flat array, where the children of the value at index i are at indices d*i + 1 ... d*i + d (d = 2 for a binary heap), and every value is less than or equal to its children. Thus, the minimum value is always at index 0.
+
+  - A larger d makes the heap shallower (log_d(n) levels), so sifting a value down touches fewer, adjacent cache lines at the cost of more comparisons per level.
+
+  - pushpop(value) pushes then pops, and replace(value) pops then pushes; both do a single sift down rather than two sifts. heapify(values) loads many values at once in O(n) time, by sifting down every value that has children, from the last one to the root.
+
+  - Iterating over a heap gives its values in array order (i.e. the root first, but otherwise unsorted).
+"""
+
+from typing import Any, Iterable, Iterator
+from iterator import ArrayIterator
+
+class Heap():
+
+  def __init__(self, size:int, d:int=2) -> None:
+    if d < 2:
+      raise ValueError
+    self.array:list = [None for _ in range(size)]
+    self.length:int = 0
+    self.size:int = size
+    self.d:int = d
+    self.modifications:int = 0
+
+  def __len__(self) -> int:
+    return self.length
+
+  def is_full(self) -> bool:
+    if len(self) == self.size:
+      return True
+    return False
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def push(self, value:Any) -> None:
+    if self.is_full():
+      raise Exception("Heap is full")
+    self.length += 1
+    self.modifications += 1
+    self._sift_up(self.length - 1, value)
+
+  def peek(self) -> Any:
+    if self.is_empty():
+      raise Exception("Heap is empty")
+    return self.array[0]
+
+  def pop(self) -> Any:
+    if self.is_empty():
+      raise Exception("Heap is empty")
+    value = self.array[0]
+    self.length -= 1
+    self.modifications += 1
+    last = self.array[self.length]
+    self.array[self.length] = None
+    if self.length > 0:
+      self._sift_down(0, last)
+    return value
+
+  def pushpop(self, value:Any) -> Any:
+    if self.is_empty() or not (self.array[0] < value):
+      return value
+    top = self.array[0]
+    self.modifications += 1
+    self._sift_down(0, value)
+    return top
+
+  def replace(self, value:Any) -> Any:
+    if self.is_empty():
+      raise Exception("Heap is empty")
+    top = self.array[0]
+    self.modifications += 1
+    self._sift_down(0, value)
+    return top
+
+  def heapify(self, values:Iterable) -> None:
+    values = list(values)
+    if len(values) > self.size:
+      raise Exception("Heap is full")
+    for i in range(len(values)):
+      self.array[i] = values[i]
+    for i in range(len(values), self.length):
+      self.array[i] = None
+    self.length = len(values)
+    self.modifications += 1
+    for i in range((self.length - 2) // self.d, -1, -1):
+      self._sift_down(i, self.array[i])
+
+  def _sift_up(self, i:int, value:Any) -> None:
+    array:list = self.array
+    d:int = self.d
+    while i > 0:
+      parent:int = (i - 1) // d
+      if not (value < array[parent]):
+        break
+      array[i] = array[parent]
+      i = parent
+    array[i] = value
+
+  def _sift_down(self, i:int, value:Any) -> None:
+    array:list = self.array
+    d:int = self.d
+    n:int = self.length
+    while True:
+      first:int = d*i + 1
+      if first >= n:
+        break
+      child:int = first
+      for j in range(first + 1, min(first + d, n)):
+        if array[j] < array[child]:
+          child = j
+      if not (array[child] < value):
+        break
+      array[i] = array[child]
+      i = child
+    array[i] = value
+
+  def __iter__(self) -> Iterator:
+    return ArrayIterator(self, self.array, 0)
+
+  def __str__(self) -> str:
+    return str(self.array[:self.length])
+
+if __name__ == "__main__":
+
+  heap:Heap = Heap(7)
+  print(heap, len(heap))
+  heap.push(3)
+  heap.push(1)
+  heap.push(2)
+  print(heap, len(heap))
+  print(heap.peek())
+  print(heap.pop())
+  print(heap, len(heap))
+  print(heap.pushpop(0))
+  print(heap.replace(5))
+  print(heap, len(heap))
+
+  heap.heapify([9, 4, 7, 6, 5, 8, 0])
+  print(heap, len(heap))
+  values:list = []
+  while not heap.is_empty():
+    values.append(heap.pop())
+  print(values)
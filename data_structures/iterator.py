@@ -0,0 +1,105 @@
+"""
+Hi! This file defines iterators, objects that step through the values stored in a data structure one at a time, in O(1) time per step.
+Here's an example:
+
+  >> for value in linked_array:
+
+  - Without an iterator, a for loop over a LinkedArray would call linked_array[0], linked_array[1], ..., and each call walks the links from the front of the array, so the loop would take O(n^2) time. A LinkedIterator instead keeps a reference to the next node, and follows one link per step.
+
+  - A ChunkIterator does the same for an UnrolledLinkedArray, stepping through each node's chunk of values before following the link to the next node.
+
+  - An EntryIterator steps through the dense entries of a Dictionary, skipping the holes left by deleted entries.
+
+  - An ArrayIterator steps through the array underlying an array, stack or queue, wrapping around the end of the array (for circular queues), and stops after len(container) values, rather than running on into the unused slots.
+
+  - Each container counts its modifications (values added or deleted). An iterator remembers the count when it is created, and raises a RuntimeError if the count has changed, rather than silently skipping or repeating values.
+"""
+
+from typing import Any
+from node import Node
+
+class Iterator():
+
+  def __init__(self, container:Any) -> None:
+    self.container = container
+    self.modifications:int = container.modifications
+    self.remaining:int = len(container)
+
+  def __iter__(self) -> "Iterator":
+    return self
+
+  def __next__(self) -> Any:
+    if self.container.modifications != self.modifications:
+      raise RuntimeError("Container changed during iteration")
+    if self.remaining == 0:
+      raise StopIteration
+    self.remaining -= 1
+    return self._next()
+
+  def _next(self) -> Any:
+    raise NotImplementedError
+
+class ArrayIterator(Iterator):
+
+  def __init__(self, container:Any, array:Any, start:int, step:int=1) -> None:
+    super().__init__(container)
+    self.array = array
+    self.i:int = start
+    self.step:int = step
+    self.size:int = len(array)
+
+  def _next(self) -> Any:
+    value = self.array[self.i]
+    self.i = (self.i + self.step) % self.size
+    return value
+
+class LinkedIterator(Iterator):
+
+  def __init__(self, container:Any, node:Node) -> None:
+    super().__init__(container)
+    self.node:Node = node
+
+  def _next(self) -> Any:
+    value = self.node.get_value()
+    self.node = self.node.get_link()
+    return value
+
+class ChunkIterator(Iterator):
+
+  def __init__(self, container:Any, node:Node) -> None:
+    super().__init__(container)
+    self.node:Node = node
+    self.i:int = 0
+
+  def _next(self) -> Any:
+    # Each node's value is a chunk (a StaticArray of values); empty chunks are skipped.
+    while self.i >= len(self.node.get_value()):
+      self.node = self.node.get_link()
+      self.i = 0
+    value = self.node.get_value()[self.i]
+    self.i += 1
+    return value
+
+class EntryIterator(Iterator):
+
+  def __init__(self, container:Any, hashes:list, keys:list, values:list=None) -> None:
+    super().__init__(container)
+    self.hashes:list = hashes
+    self.keys:list = keys
+    self.values:list = values
+    self.i:int = 0
+
+  def _next(self) -> Any:
+    # Deleted entries leave holes (whose hash is None), which are skipped; yields keys, or (key, value) pairs if values are given.
+    while self.hashes[self.i] is None:
+      self.i += 1
+    entry:int = self.i
+    self.i += 1
+    if self.values is None:
+      return self.keys[entry]
+    return self.keys[entry], self.values[entry]
+
+def reversed_linked_iterator(container:Any, node:Node) -> ArrayIterator:
+  # Nodes only link forwards, so the values are collected in one O(n) pass, and then stepped through backwards.
+  values:list = list(LinkedIterator(container, node))
+  return ArrayIterator(container, values, len(values) - 1, -1)
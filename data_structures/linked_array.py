@@ -1,14 +1,19 @@
 """
 """
 
-from typing import Any
+from typing import Any, Iterator
 from node import Node
+from iterator import LinkedIterator, reversed_linked_iterator
 
 class LinkedArray():
 
   def __init__(self) -> None:
     self.front = Node()
+    self.back = self.front
     self.length = 0
+    self.modifications = 0
+    self.finger_index = 0
+    self.finger_node = self.front
 
   def __len__(self) -> int:
     return self.length
@@ -21,50 +26,98 @@ class LinkedArray():
   def __setitem__(self, i:int, value:Any) -> None:
     if (i < 0) or (i >= len(self)):
       raise IndexError
-    node = self.front
-    for _ in range(i):
-      node = node.get_link()
-    node.set_value(value)
+    self._node(i).set_value(value)
 
   def __getitem__(self, i:int) -> Any:
     if (i < 0) or (i >= len(self)):
       raise IndexError
-    node = self.front
-    for _ in range(i):
-      node = node.get_link()
-    return node.get_value()
+    return self._node(i).get_value()
   
   def append(self, value:Any) -> None:
-    node = self.front
-    for _ in range(len(self)):
-      node = node.get_link()
+    node = Node()
+    self.back.set_value(value)
+    self.back.set_link(node)
+    self.back = node
+    self.length += 1
+    self.modifications += 1
+
+  def insert(self, i:int, value:Any) -> None:
+    if (i < 0) or (i > len(self)):
+      raise IndexError
+    if i == len(self):
+      self.append(value)
+      return
+
+    node = Node()
     node.set_value(value)
-    node.set_link(Node())
+    if i == 0:
+      node.set_link(self.front)
+      self.front = node
+      self._reset_finger()
+    else:
+      previous:Node = self._node(i-1)
+      node.set_link(previous.get_link())
+      previous.set_link(node)
+
     self.length += 1
+    self.modifications += 1
   
   def find(self, value:Any) -> int:
     node = self.front
     for i in range(len(self)):
       if node.get_value() == value:
+        self.finger_index = i
+        self.finger_node = node
         return i
       node = node.get_link()
     raise ValueError
     
   def __delitem__(self, i:int) -> None:
+    self.pop(i)
+
+  def pop(self, i:int=None) -> Any:
+    if i is None:
+      i = len(self) - 1
     if (i < 0) or (i >= len(self)):
       raise IndexError
     
     self.length -= 1
+    self.modifications += 1
     
     if i == 0:
+      deleted_node:Node = self.front
       self.front = self.front.get_link()
+      self._reset_finger()
     else:
-      node:Node = self.front
-      for _ in range(i-1):
-        node = node.get_link()
-      deleted_node:Node = node.get_link()
+      node:Node = self._node(i-1)
+      deleted_node = node.get_link()
       node.set_link(deleted_node.get_link())
+    return deleted_node.get_value()
+
+  def _node(self, i:int) -> Node:
+    # Walks from the finger (the last node accessed) if it is at or before i, else from the front, and moves the finger to i.
+    if self.finger_index <= i:
+      node:Node = self.finger_node
+      start:int = self.finger_index
+    else:
+      node = self.front
+      start = 0
+    for _ in range(i - start):
+      node = node.get_link()
+    self.finger_index = i
+    self.finger_node = node
+    return node
+
+  def _reset_finger(self) -> None:
+    self.finger_index = 0
+    self.finger_node = self.front
   
+  def __iter__(self) -> Iterator:
+    return LinkedIterator(self, self.front)
+
+  def __reversed__(self) -> Iterator:
+    return reversed_linked_iterator(self, self.front)
+
   def __str__(self) -> str:
     values:list = []
     node = self.front
@@ -1,16 +1,19 @@
 """
 """
 
-from typing import Any
-from node import Node
+from typing import Any, Iterator
+from node import Node, NodePool
+from iterator import LinkedIterator, reversed_linked_iterator
 
 class LinkedQueue():
 
-  def __init__(self) -> None:
-    node = Node()
+  def __init__(self, pool:NodePool=None) -> None:
+    self.pool = pool
+    node = self._new_node()
     self.front = node
     self.back = node
     self.length = 0
+    self.modifications = 0
 
   def __len__(self) -> int:
     return self.length
@@ -22,10 +25,11 @@ class LinkedQueue():
   
   def append(self, value:Any) -> None:
     self.back.set_value(value)
-    node = Node()
+    node = self._new_node()
     self.back.set_link(node)
     self.back = node
     self.length += 1
+    self.modifications += 1
 
   def peek(self) -> Any:
     if self.is_empty():
@@ -35,11 +39,26 @@ class LinkedQueue():
   def pop(self) -> Any:
     if self.is_empty():
       raise Exception("Queue is empty")
-    value = self.front.get_value()
-    self.front = self.front.get_link()
+    node = self.front
+    value = node.get_value()
+    self.front = node.get_link()
+    if self.pool is not None:
+      self.pool.put(node)
     self.length -= 1
+    self.modifications += 1
     return value
 
+  def _new_node(self) -> Node:
+    if self.pool is None:
+      return Node()
+    return self.pool.get()
+
+  def __iter__(self) -> Iterator:
+    return LinkedIterator(self, self.front)
+
+  def __reversed__(self) -> Iterator:
+    return reversed_linked_iterator(self, self.front)
+
   def __str__(self) -> str:
     values:list = []
     node = self.front
@@ -1,14 +1,17 @@
 """
 """
 
-from typing import Any
-from node import Node
+from typing import Any, Iterator
+from node import Node, NodePool
+from iterator import LinkedIterator, reversed_linked_iterator
 
 class LinkedStack():
 
-  def __init__(self) -> None:
-    self.top = Node()
+  def __init__(self, pool:NodePool=None) -> None:
+    self.pool = pool
+    self.top = self._new_node()
     self.length = 0
+    self.modifications = 0
 
   def __len__(self) -> int:
     return self.length
@@ -20,10 +23,11 @@ class LinkedStack():
   
   def push(self, value:Any) -> None:
     self.top.set_value(value)
-    node = Node()
+    node = self._new_node()
     node.set_link(self.top)
     self.top = node
     self.length += 1
+    self.modifications += 1
 
   def peek(self) -> Any:
     if self.is_empty():
@@ -36,10 +40,25 @@ class LinkedStack():
       raise Exception("Stack is empty")
     node = self.top.get_link()
     value = node.get_value()
+    node.set_value(None)
+    if self.pool is not None:
+      self.pool.put(self.top)
     self.top = node
     self.length -= 1
+    self.modifications += 1
     return value
 
+  def _new_node(self) -> Node:
+    if self.pool is None:
+      return Node()
+    return self.pool.get()
+
+  def __iter__(self) -> Iterator:
+    return LinkedIterator(self, self.top.get_link())
+
+  def __reversed__(self) -> Iterator:
+    return reversed_linked_iterator(self, self.top.get_link())
+
   def __str__(self) -> str:
     values:list = []
     node = self.top
@@ -1,4 +1,12 @@
 """
+Hi! This file defines a node, which stores a value and a link to another node, and a node pool, which recycles nodes that are no longer used.
+Here's an example:
+
+  >> node = Node()
+
+  - Node declares __slots__, so each node stores its link and value in two fixed slots rather than in a per-instance __dict__, which makes nodes several times smaller and faster to create.
+
+  - Linked containers that push and pop constantly create a node for every value pushed, and drop one for every value popped. A NodePool keeps up to size dropped nodes on a free list (linked through the nodes themselves), and hands them back out instead of creating new nodes. hits and misses count how many requests were served from the free list, and how many needed a new node, which helps choose the size of the pool.
 """
 
 from typing import Any, TypeVar
@@ -6,6 +14,8 @@ Node = TypeVar("Node")
 
 class Node():
 
+  __slots__ = ("link", "value")
+
   def __init__(self) -> None:
     self.link = None
     self.value = None
@@ -25,12 +35,50 @@ class Node():
   def get_value(self) -> Any:
     return self.value
 
+class NodePool():
+
+  def __init__(self, size:int) -> None:
+    self.free:Node = None
+    self.length:int = 0
+    self.size:int = size
+    self.hits:int = 0
+    self.misses:int = 0
+
+  def __len__(self) -> int:
+    return self.length
+
+  def get(self) -> Node:
+    if self.free is None:
+      self.misses += 1
+      return Node()
+    self.hits += 1
+    node:Node = self.free
+    self.free = node.link
+    self.length -= 1
+    node.link = None
+    return node
+
+  def put(self, node:Node) -> None:
+    if self.length == self.size:
+      return
+    node.value = None
+    node.link = self.free
+    self.free = node
+    self.length += 1
+
 if __name__ == "__main__":
   
-  A:Node = Node(1)
-  B:Node = Node(2)
+  A:Node = Node()
+  A.set_value(1)
+  B:Node = Node()
+  B.set_value(2)
   A.set_link(B)
   print(A)
   print(A.get_link())
   print(B)
-  print(B.get_link())
\ No newline at end of file
+  print(B.get_link())
+
+  pool:NodePool = NodePool(1)
+  pool.put(pool.get())
+  pool.get()
+  print(pool.hits, pool.misses, len(pool))
\ No newline at end of file
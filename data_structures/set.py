@@ -0,0 +1,211 @@
+"""
+Hi! This file defines a set, a data structure that stores unique values, where adding, discarding and checking whether a value is stored takes O(1) expected time.
+Here's an example:
+
+  >> values = Set()
+  >> values.add(1)
+
+  - A Set stores its values as the keys of a Dictionary (see dictionary.py), so values are kept in insertion order, and the Dictionary's compact Robin Hood hashing is reused.
+
+  - The set algebra (union, intersection, difference and symmetric_difference) sizes the result before filling it, so it is never resized along the way, and only iterates over the smaller of the two sets wherever possible; e.g. the intersection of a set of 10 values with a set of 1,000,000 values takes 10 lookups.
+
+  - When the values are all small non-negative integers (e.g. IDs from 0 to size-1), a BitSet stores them as the bits of a bytearray; value i is stored if bit i is set. This takes 1 bit per possible value, rather than a hash, key and index slot per stored value, and the set algebra becomes bitwise operations (|, &, ^) on whole machine words at a time.
+"""
+
+from typing import Any, Iterable, Iterator
+from dictionary import Dictionary
+
+class Set():
+
+  def __init__(self, size:int=8) -> None:
+    self.dictionary:Dictionary = Dictionary(size)
+
+  def __len__(self) -> int:
+    return len(self.dictionary)
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def add(self, value:Any) -> None:
+    self.dictionary[value] = None
+
+  def discard(self, value:Any) -> None:
+    if value in self.dictionary:
+      del self.dictionary[value]
+
+  def __contains__(self, value:Any) -> bool:
+    return value in self.dictionary
+
+  def __iter__(self) -> Iterator:
+    return iter(self.dictionary)
+
+  def update(self, values:Iterable) -> None:
+    for value in values:
+      self.dictionary[value] = None
+
+  def union(self, other:"Set") -> "Set":
+    larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+    result:Set = Set(len(larger) + len(smaller))
+    result.update(larger)
+    result.update(smaller)
+    return result
+
+  def intersection(self, other:"Set") -> "Set":
+    larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+    result:Set = Set(len(smaller))
+    for value in smaller:
+      if value in larger:
+        result.add(value)
+    return result
+
+  def difference(self, other:"Set") -> "Set":
+    result:Set = Set(len(self))
+    if len(self) <= len(other):
+      for value in self:
+        if value not in other:
+          result.add(value)
+    else:
+      result.update(self)
+      for value in other:
+        result.discard(value)
+    return result
+
+  def symmetric_difference(self, other:"Set") -> "Set":
+    larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+    result:Set = Set(len(larger) + len(smaller))
+    result.update(larger)
+    for value in smaller:
+      if value in larger:
+        result.discard(value)
+      else:
+        result.add(value)
+    return result
+
+  def __or__(self, other:"Set") -> "Set":
+    return self.union(other)
+
+  def __and__(self, other:"Set") -> "Set":
+    return self.intersection(other)
+
+  def __sub__(self, other:"Set") -> "Set":
+    return self.difference(other)
+
+  def __xor__(self, other:"Set") -> "Set":
+    return self.symmetric_difference(other)
+
+  def __str__(self) -> str:
+    return "{" + ", ".join(repr(value) for value in self) + "}"
+
+class BitSet():
+
+  def __init__(self, size:int) -> None:
+    self.bits:bytearray = bytearray((size + 7) // 8)
+    self.length:int = 0
+    self.size:int = size
+    self.modifications:int = 0
+
+  def __len__(self) -> int:
+    return self.length
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def add(self, value:int) -> None:
+    if (value < 0) or (value >= self.size):
+      raise ValueError
+    mask:int = 1 << (value & 7)
+    if not (self.bits[value >> 3] & mask):
+      self.bits[value >> 3] |= mask
+      self.length += 1
+      self.modifications += 1
+
+  def discard(self, value:int) -> None:
+    if (value < 0) or (value >= self.size):
+      return
+    mask:int = 1 << (value & 7)
+    if self.bits[value >> 3] & mask:
+      self.bits[value >> 3] &= ~mask
+      self.length -= 1
+      self.modifications += 1
+
+  def __contains__(self, value:int) -> bool:
+    if (value < 0) or (value >= self.size):
+      return False
+    return bool(self.bits[value >> 3] & (1 << (value & 7)))
+
+  def __iter__(self) -> Iterator:
+    bits:bytearray = self.bits
+    modifications:int = self.modifications
+    for i in range(len(bits)):
+      byte:int = bits[i]
+      while byte:
+        lowest:int = byte & -byte
+        yield (i << 3) + lowest.bit_length() - 1
+        if self.modifications != modifications:
+          raise RuntimeError("Container changed during iteration")
+        byte ^= lowest
+
+  def union(self, other:"BitSet") -> "BitSet":
+    return BitSet._from_int(max(self.size, other.size), self._to_int() | other._to_int())
+
+  def intersection(self, other:"BitSet") -> "BitSet":
+    return BitSet._from_int(min(self.size, other.size), self._to_int() & other._to_int())
+
+  def difference(self, other:"BitSet") -> "BitSet":
+    return BitSet._from_int(self.size, self._to_int() & ~other._to_int())
+
+  def symmetric_difference(self, other:"BitSet") -> "BitSet":
+    return BitSet._from_int(max(self.size, other.size), self._to_int() ^ other._to_int())
+
+  def __or__(self, other:"BitSet") -> "BitSet":
+    return self.union(other)
+
+  def __and__(self, other:"BitSet") -> "BitSet":
+    return self.intersection(other)
+
+  def __sub__(self, other:"BitSet") -> "BitSet":
+    return self.difference(other)
+
+  def __xor__(self, other:"BitSet") -> "BitSet":
+    return self.symmetric_difference(other)
+
+  def _to_int(self) -> int:
+    # Bit i of the integer is bit (i & 7) of byte (i >> 3), so whole words are combined at once by int's bitwise operators.
+    return int.from_bytes(self.bits, "little")
+
+  @staticmethod
+  def _from_int(size:int, bits:int) -> "BitSet":
+    result:BitSet = BitSet(size)
+    bits &= (1 << size) - 1
+    result.bits[:] = bits.to_bytes(len(result.bits), "little")
+    result.length = bits.bit_count()
+    return result
+
+  def __str__(self) -> str:
+    return "{" + ", ".join(str(value) for value in self) + "}"
+
+if __name__ == "__main__":
+
+  A:Set = Set()
+  A.update([1, 3, 2, 5])
+  B:Set = Set()
+  B.update([2, 4, 5])
+  print(A, len(A), B, len(B))
+  print(A | B, A & B, A - B, A ^ B)
+  A.discard(3)
+  print(A, len(A), 3 in A)
+
+  C:BitSet = BitSet(16)
+  for value in [1, 3, 2, 5]:
+    C.add(value)
+  D:BitSet = BitSet(16)
+  for value in [2, 4, 5, 15]:
+    D.add(value)
+  print(C, len(C), D, len(D))
+  print(C | D, C & D, C - D, C ^ D)
+  C.discard(3)
+  print(C, len(C), 3 in C)
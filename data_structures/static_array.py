@@ -7,16 +7,29 @@ Here's an example:
   - Values are stored in memory, which is allocated to the array when initialised.
 
   - But what if the number of values we want to store is unknown? This would require a dynamic array, which 
+
+  - Inserting or deleting values in the middle of the array shifts every value after them. Rather than moving one value at a time, insert, insert_many, delete_range, __delitem__ and slice assignment (e.g. array[2:5] = values) move the whole tail with a single block copy. If the order of values doesn't matter, swap_remove(i) deletes in O(1) time by moving the last value into the gap.
+
+  - By default, values are stored in a Python list, where each slot is a pointer to a separate (boxed) object. For numbers, a typecode can be given instead (e.g. StaticArray(3, typecode="d") for floats, "q" for 64-bit integers; see the array module), and values are then stored unboxed, in one contiguous block of typed memory. memoryview() returns a view of the stored values without copying them, which can be handed to NumPy (numpy.asarray), written to a file, or sent over a socket. The block is never resized, so views stay valid for the lifetime of the array.
 """
 
-from typing import Any
+from array import array
+from typing import Any, Iterable, Iterator
+from iterator import ArrayIterator
 
 class StaticArray():
 
-  def __init__(self, size:int) -> None:
-    self.array:list = [None for _ in range(size)]
+  def __init__(self, size:int, typecode:str=None) -> None:
+    if typecode is None:
+      self.array:list = [None for _ in range(size)]
+      self.empty:Any = None
+    else:
+      self.empty = array(typecode, bytes(array(typecode).itemsize))[0]
+      self.array = array(typecode, [self.empty]) * size
+    self.typecode:str = typecode
     self.length:int = 0
     self.size:int = size
+    self.modifications:int = 0
 
   def __len__(self) -> int:
     return self.length
@@ -32,17 +45,46 @@ class StaticArray():
     return False
   
   def __setitem__(self, i:int, value:Any) -> None:
+    if isinstance(i, slice):
+      start, stop, step = i.indices(len(self))
+      if step == 1:
+        self._replace(start, max(start, stop), value)
+      else:
+        values:list = self._block(value)
+        if len(values) != len(range(start, stop, step)):
+          raise ValueError
+        if len(values) > 0:
+          self.array[self._slice(i)] = values
+      return
     if (i < 0) or (i >= len(self)):
       raise IndexError
     self.array[i] = value
 
   def __getitem__(self, i:int) -> Any:
+    if isinstance(i, slice):
+      # The sliced copy becomes the new array's storage directly, rather than being copied into freshly allocated storage.
+      sliced:StaticArray = StaticArray(0, self.typecode)
+      sliced.array = self.array[self._slice(i)]
+      sliced.length = len(sliced.array)
+      sliced.size = len(sliced.array)
+      return sliced
     return self.array[i]
   
   def append(self, value:Any) -> None:
     self.length += 1
+    self.modifications += 1
     self[len(self)-1] = value
 
+  def insert(self, i:int, value:Any) -> None:
+    if (i < 0) or (i > len(self)):
+      raise IndexError
+    self._replace(i, i, [value])
+
+  def insert_many(self, i:int, values:Iterable) -> None:
+    if (i < 0) or (i > len(self)):
+      raise IndexError
+    self._replace(i, i, values)
+
   def find(self, value:Any) -> int:
     for i in range(len(self)):
       if self[i] == value:
@@ -50,14 +92,86 @@ class StaticArray():
     raise ValueError
     
   def __delitem__(self, i:int) -> None:
+    if isinstance(i, slice):
+      start, stop, step = i.indices(len(self))
+      if step != 1:
+        values:list = self.array[:self.length]
+        del values[i]
+        self._replace(0, len(self), values)
+        return
+      self._replace(start, max(start, stop), [])
+      return
     if (i < 0) or (i >= len(self)):
       raise IndexError
+    self._replace(i, i + 1, [])
+
+  def delete_range(self, start:int, stop:int) -> None:
+    if (start < 0) or (stop > len(self)) or (start > stop):
+      raise IndexError
+    self._replace(start, stop, [])
+
+  def swap_remove(self, i:int) -> Any:
+    if (i < 0) or (i >= len(self)):
+      raise IndexError
+    value = self.array[i]
     self.length -= 1
-    for i in range(i, len(self)):
-      self[i] = self[i + 1]
+    self.modifications += 1
+    self.array[i] = self.array[self.length]
+    self.array[self.length] = self.empty
+    return value
+
+  def _slice(self, i:slice) -> slice:
+    # The slice i of the stored values, as a slice of the underlying array. For negative steps, i.indices gives -1 to mean "before index 0", which would mean the last slot if used as a slice again.
+    start, stop, step = i.indices(len(self))
+    if start < 0:
+      return slice(0, 0)
+    return slice(start, None if stop < 0 else stop, step)
+
+  def _replace(self, start:int, stop:int, values:Iterable) -> None:
+    # Replaces array[start:stop] with values, moving the tail array[stop:length] once, as a block.
+    values = self._block(values)
+    length:int = len(self)
+    new_length:int = length - (stop - start) + len(values)
+    if new_length > self.size:
+      raise Exception("Array is full")
+    # Every slice is replaced with one of the same length, and empty ones are skipped, so typed storage is never resized (which fails while a memoryview of it exists).
+    if (new_length != length) and (stop < length):
+      self.array[start + len(values):new_length] = self.array[stop:length]
+    if new_length < length:
+      self.array[new_length:length] = self._block([self.empty]) * (length - new_length)
+    if len(values) > 0:
+      self.array[start:start + len(values)] = values
+    if new_length != length:
+      self.length = new_length
+      self.modifications += 1
   
+  def _block(self, values:Iterable) -> list:
+    # Slices of typed storage can only be assigned from typed arrays of the same typecode. A StaticArray's values are sliced out of its storage at once, rather than iterated over one at a time.
+    if isinstance(values, StaticArray):
+      stored = values.array[:len(values)]
+      if values.typecode == self.typecode:
+        return stored
+      values = stored
+    if self.typecode is None:
+      return list(values)
+    return array(self.typecode, values)
+
+  def __buffer__(self, flags:int) -> memoryview:
+    return self.memoryview()
+
+  def memoryview(self) -> memoryview:
+    if self.typecode is None:
+      raise TypeError("Only typed arrays support memoryview")
+    return memoryview(self.array)[:self.length]
+
+  def __iter__(self) -> Iterator:
+    return ArrayIterator(self, self.array, 0)
+
+  def __reversed__(self) -> Iterator:
+    return ArrayIterator(self, self.array, self.length - 1, -1)
+
   def __str__(self) -> str:
-    return str(self.array[:self.length])
+    return str(list(self.array[:self.length]))
   
 if __name__ == "__main__":
 
@@ -81,3 +195,48 @@ if __name__ == "__main__":
 
   static_array.append(7)
   print(static_array, len(static_array))
+
+  static_array = StaticArray(8)
+  static_array.insert_many(0, [0, 1, 2, 3, 4, 5])
+  static_array.insert(3, 9)
+  print(static_array, len(static_array), static_array[2:5])
+  static_array.delete_range(1, 3)
+  print(static_array, len(static_array))
+  print(static_array.swap_remove(0), static_array, len(static_array))
+
+  static_array = StaticArray(4, typecode="d")
+  static_array.insert_many(0, [1.5, 2.5, 3.5])
+  view:memoryview = static_array.memoryview()
+  static_array[0] = 0.5
+  print(static_array, len(static_array), view.tolist(), view.nbytes)
+
+  # Extended and negative-step slices behave like a list's.
+  for step in (-1, -2, 2, 3):
+    for typecode in (None, "q"):
+      values:list = [0, 1, 2, 3, 4, 5, 6]
+      static_array = StaticArray(10, typecode)
+      static_array.insert_many(0, values)
+      replacement:list = [9] * len(values[::step])
+      static_array[::step] = replacement
+      values[::step] = replacement
+      assert list(static_array) == values
+      del static_array[-2:-6:step]
+      del values[-2:-6:step]
+      assert list(static_array) == values
+      assert list(static_array.array[len(static_array):]) == [static_array.empty] * (10 - len(static_array))
+  print("Extended slices match lists")
+
+  # A memoryview stays valid across inserts and deletes.
+  static_array = StaticArray(8, typecode="q")
+  static_array.insert_many(0, [0, 1, 2, 3, 4, 5])
+  view = static_array.memoryview()
+  del static_array[1]
+  static_array.delete_range(0, 2)
+  static_array[0:2] = [7]
+  static_array[0:0] = []
+  static_array.insert_many(1, [])
+  del static_array[::-2]
+  static_array.insert(0, 9)
+  assert list(static_array) == [9, 7] and view.tolist()[:2] == [9, 7]
+  view.release()
+  print("Views survive inserts and deletes")
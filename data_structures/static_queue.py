@@ -1,16 +1,33 @@
 """
+Hi! This file defines a queue, a data structure that stores values in first-in-first-out order, in a circular array.
+Here's an example:
+
+  >> queue = Queue(3)
+
+  - Values are appended at the back and popped from the front, and both indices wrap around the end of the array. The array's capacity is always a power of two, so wrapping an index is a bit-mask (i & (capacity - 1)) rather than a modulo.
+
+  - By default, the queue holds at most size values, and raises an exception when full. With growable=True, a full queue instead copies its values, in order, into an array twice the size (relinearising them so the front is at index 0), and keeps going.
+
+  - extend(values) and pop_many(k) move many values at once. Since the values occupy at most two contiguous runs of the array (before and after the wrap point), each is moved with at most two slice copies, rather than one call per value.
 """
 
-from typing import Any
+from typing import Any, Iterable, Iterator
+from iterator import ArrayIterator
 
 class Queue():
 
-  def __init__(self, size:int) -> None:
-    self.array = [None for _ in range(size)]
+  def __init__(self, size:int, growable:bool=False) -> None:
+    capacity:int = 1
+    while capacity < size:
+      capacity *= 2
+    self.array = [None for _ in range(capacity)]
+    self.mask = capacity - 1
     self.front = 0
     self.back = 0
     self.length = 0
-    self.size = size
+    self.size = capacity if growable else size
+    self.growable = growable
+    self.modifications = 0
 
   def __len__(self) -> int:
     return self.length
@@ -27,10 +44,27 @@ class Queue():
   
   def append(self, value:Any) -> None:
     if self.is_full():
-      raise Exception("Queue is full")
+      if not self.growable:
+        raise Exception("Queue is full")
+      self._resize(len(self) + 1)
     self.array[self.back] = value
-    self.back = (self.back + 1) % self.size
+    self.back = (self.back + 1) & self.mask
     self.length += 1
+    self.modifications += 1
+
+  def extend(self, values:Iterable) -> None:
+    values = list(values)
+    k:int = len(values)
+    if len(self) + k > self.size:
+      if not self.growable:
+        raise Exception("Queue is full")
+      self._resize(len(self) + k)
+    first:int = min(k, len(self.array) - self.back)
+    self.array[self.back:self.back + first] = values[:first]
+    self.array[:k - first] = values[first:]
+    self.back = (self.back + k) & self.mask
+    self.length += k
+    self.modifications += 1
 
   def peek(self) -> Any:
     if self.is_empty():
@@ -41,17 +75,46 @@ class Queue():
     if self.is_empty():
       raise Exception("Queue is empty")
     value = self.array[self.front]
-    self.front = (self.front + 1) % self.size
+    self.array[self.front] = None
+    self.front = (self.front + 1) & self.mask
     self.length -= 1
+    self.modifications += 1
     return value
 
+  def pop_many(self, k:int) -> list:
+    # Pops up to k values (fewer if the queue holds fewer), in order.
+    if k < 0:
+      raise ValueError
+    k = min(k, len(self))
+    first:int = min(k, len(self.array) - self.front)
+    values:list = self.array[self.front:self.front + first] + self.array[:k - first]
+    self.array[self.front:self.front + first] = [None] * first
+    self.array[:k - first] = [None] * (k - first)
+    self.front = (self.front + k) & self.mask
+    self.length -= k
+    self.modifications += 1
+    return values
+
+  def _resize(self, size:int) -> None:
+    capacity:int = len(self.array)
+    while capacity < size:
+      capacity *= 2
+    values:list = self.pop_many(len(self))
+    self.array = values + [None] * (capacity - len(values))
+    self.mask = capacity - 1
+    self.front = 0
+    self.back = len(values) & self.mask
+    self.length = len(values)
+    self.size = capacity
+
+  def __iter__(self) -> Iterator:
+    return ArrayIterator(self, self.array, self.front)
+
+  def __reversed__(self) -> Iterator:
+    return ArrayIterator(self, self.array, (self.back - 1) & self.mask, -1)
+
   def __str__(self) -> str:
-    values:list = []
-    i = self.front
-    for _ in range(len(self)):
-      values.append(self.array[i])
-      i = (i + 1) % self.size
-    return str(values)
+    return str(list(self))
   
 if __name__ == "__main__":
 
@@ -68,4 +131,16 @@ if __name__ == "__main__":
   queue.pop()
   print(queue, len(queue))
   queue.pop()
-  print(queue, len(queue))
\ No newline at end of file
+  print(queue, len(queue))
+
+  queue = Queue(2, growable=True)
+  queue.extend([1, 3, 2, 5, 4])
+  print(queue, len(queue), queue.size)
+  print(queue.pop_many(3))
+  print(queue, len(queue))
+
+  try:
+    queue.pop_many(-1)
+    raise AssertionError("pop_many accepted k < 0")
+  except ValueError:
+    print(queue, len(queue))
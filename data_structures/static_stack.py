@@ -1,7 +1,8 @@
 """
 """
 
-from typing import Any
+from typing import Any, Iterator
+from iterator import ArrayIterator
 
 class Stack():
 
@@ -10,6 +11,7 @@ class Stack():
     self.top = 0
     self.length = 0
     self.size = size
+    self.modifications = 0
 
   def __len__(self) -> int:
     return self.length
@@ -30,6 +32,7 @@ class Stack():
     self.array[self.top] = value
     self.top += 1
     self.length += 1
+    self.modifications += 1
 
   def peek(self) -> Any:
     if self.is_empty():
@@ -41,8 +44,15 @@ class Stack():
       raise Exception("Stack is empty")
     self.top -= 1
     self.length -= 1
+    self.modifications += 1
     return self.array[self.top]
 
+  def __iter__(self) -> Iterator:
+    return ArrayIterator(self, self.array, self.top - 1, -1)
+
+  def __reversed__(self) -> Iterator:
+    return ArrayIterator(self, self.array, 0)
+
   def __str__(self) -> str:
     values = self.array[:self.top]
     values.reverse()
@@ -0,0 +1,209 @@
+"""
+Hi! This file defines an unrolled linked array, a linked array where each node stores a chunk of up to chunk_size values (in a StaticArray), rather than a single value.
+Here's an example:
+
+  >> array = UnrolledLinkedArray(4)
+
+  - A LinkedArray pays for a whole node (and a link to follow) per value. Storing chunks of values cuts the number of nodes, and the number of links followed to reach index i, by a factor of chunk_size, and the values within a chunk sit next to each other in memory.
+
+  - Inserting into a full chunk splits it into two half-full chunks. Deleting from a chunk that drops below half full either merges it with the next chunk (if their values fit in one chunk), or moves values over from the next chunk to even them out. The last chunk has no next chunk, and is unlinked once it is empty. Thus every chunk except the last is at least half full, so reaching index i follows at most O(n / chunk_size) links.
+
+  - With index=True, the array also keeps a list of its chunks and the index of the first value in each chunk. This list is rebuilt (in O(n / chunk_size) time) only when a read follows a modification, and then each read binary searches it in O(log(n / chunk_size)) time. With chunk_size close to sqrt(n), rebuilds take O(sqrt(n)) time.
+
+  - It supports the same methods as LinkedArray (append, insert, pop, find, __getitem__, __setitem__, __delitem__), so it can be used in its place.
+"""
+
+from bisect import bisect_right
+from typing import Any, Iterator
+from node import Node
+from static_array import StaticArray
+from iterator import ArrayIterator, ChunkIterator
+
+class UnrolledLinkedArray():
+
+  def __init__(self, chunk_size:int=64, index:bool=False) -> None:
+    if chunk_size < 2:
+      raise ValueError
+    self.chunk_size:int = chunk_size
+    self.front:Node = self._new_chunk()
+    self.back:Node = self.front
+    self.length:int = 0
+    self.modifications:int = 0
+    self.index:bool = index
+    self.chunks:list = []
+    self.starts:list = []
+    self.indexed:bool = False
+
+  def __len__(self) -> int:
+    return self.length
+
+  def is_empty(self) -> bool:
+    if len(self) == 0:
+      return True
+    return False
+
+  def __setitem__(self, i:int, value:Any) -> None:
+    if (i < 0) or (i >= len(self)):
+      raise IndexError
+    node, offset = self._locate(i)
+    node.get_value()[offset] = value
+
+  def __getitem__(self, i:int) -> Any:
+    if (i < 0) or (i >= len(self)):
+      raise IndexError
+    node, offset = self._locate(i)
+    return node.get_value()[offset]
+
+  def append(self, value:Any) -> None:
+    if self.back.get_value().is_full():
+      node:Node = self._new_chunk()
+      self.back.set_link(node)
+      self.back = node
+    self.back.get_value().append(value)
+    self._modified(1)
+
+  def insert(self, i:int, value:Any) -> None:
+    if (i < 0) or (i > len(self)):
+      raise IndexError
+    if i == len(self):
+      self.append(value)
+      return
+
+    node, offset = self._locate(i)
+    chunk:StaticArray = node.get_value()
+    if chunk.is_full():
+      half:int = len(chunk) // 2
+      new_node:Node = self._new_chunk()
+      new_node.get_value().insert_many(0, chunk.array[half:len(chunk)])
+      chunk.delete_range(half, len(chunk))
+      new_node.set_link(node.get_link())
+      node.set_link(new_node)
+      if self.back is node:
+        self.back = new_node
+      if offset > half:
+        node = new_node
+        offset -= half
+    node.get_value().insert(offset, value)
+    self._modified(1)
+
+  def find(self, value:Any) -> int:
+    node:Node = self.front
+    start:int = 0
+    while node is not None:
+      chunk:StaticArray = node.get_value()
+      for offset in range(len(chunk)):
+        if chunk[offset] == value:
+          return start + offset
+      start += len(chunk)
+      node = node.get_link()
+    raise ValueError
+
+  def __delitem__(self, i:int) -> None:
+    self.pop(i)
+
+  def pop(self, i:int=None) -> Any:
+    if i is None:
+      i = len(self) - 1
+    if (i < 0) or (i >= len(self)):
+      raise IndexError
+
+    node, offset = self._locate(i)
+    chunk:StaticArray = node.get_value()
+    value = chunk[offset]
+    del chunk[offset]
+
+    following:Node = node.get_link()
+    if (len(chunk) < self.chunk_size // 2) and (following is not None):
+      other:StaticArray = following.get_value()
+      if len(chunk) + len(other) <= self.chunk_size:
+        chunk.insert_many(len(chunk), other.array[:len(other)])
+        node.set_link(following.get_link())
+        if self.back is following:
+          self.back = node
+      else:
+        moved:int = (len(other) - len(chunk)) // 2
+        chunk.insert_many(len(chunk), other.array[:moved])
+        other.delete_range(0, moved)
+    elif chunk.is_empty() and (node is not self.front):
+      self._unlink(node)
+
+    self._modified(-1)
+    return value
+
+  def _unlink(self, node:Node) -> None:
+    # Removes an emptied chunk (only ever the back one, since an emptied chunk with a following chunk is merged with it), by walking to the chunk before it.
+    previous:Node = self.front
+    while previous.get_link() is not node:
+      previous = previous.get_link()
+    previous.set_link(node.get_link())
+    if self.back is node:
+      self.back = previous
+
+  def _locate(self, i:int) -> tuple:
+    # Finds the node holding index i, and the offset of index i within its chunk.
+    if self.index:
+      if not self.indexed:
+        self._build_index()
+      k:int = bisect_right(self.starts, i) - 1
+      return self.chunks[k], i - self.starts[k]
+
+    node:Node = self.front
+    while i >= len(node.get_value()):
+      i -= len(node.get_value())
+      node = node.get_link()
+    return node, i
+
+  def _build_index(self) -> None:
+    self.chunks = []
+    self.starts = []
+    node:Node = self.front
+    start:int = 0
+    while node is not None:
+      self.chunks.append(node)
+      self.starts.append(start)
+      start += len(node.get_value())
+      node = node.get_link()
+    self.indexed = True
+
+  def _modified(self, change:int) -> None:
+    self.length += change
+    self.modifications += 1
+    self.indexed = False
+
+  def _new_chunk(self) -> Node:
+    node:Node = Node()
+    node.set_value(StaticArray(self.chunk_size))
+    return node
+
+  def __iter__(self) -> Iterator:
+    return ChunkIterator(self, self.front)
+
+  def __reversed__(self) -> Iterator:
+    values:list = list(self)
+    return ArrayIterator(self, values, len(values) - 1, -1)
+
+  def __str__(self) -> str:
+    return str(list(self))
+
+if __name__ == "__main__":
+
+  unrolled_linked_array:UnrolledLinkedArray = UnrolledLinkedArray(4)
+
+  print(unrolled_linked_array, len(unrolled_linked_array))
+  unrolled_linked_array.append(1)
+  unrolled_linked_array.append(3)
+  unrolled_linked_array.append(2)
+  print(unrolled_linked_array, len(unrolled_linked_array))
+
+  print(unrolled_linked_array[0], unrolled_linked_array[1], unrolled_linked_array[2])
+  unrolled_linked_array[0] = 4
+  unrolled_linked_array[1] = 6
+  unrolled_linked_array[2] = 5
+
+  print(unrolled_linked_array, len(unrolled_linked_array))
+  i = unrolled_linked_array.find(6)
+  del unrolled_linked_array[i]
+  print(unrolled_linked_array, len(unrolled_linked_array))
+
+  unrolled_linked_array.append(7)
+  print(unrolled_linked_array, len(unrolled_linked_array))